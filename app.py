@@ -1,7 +1,9 @@
 """Streamlit web application for the RAG chatbot."""
 
+import time
 import streamlit as st
 from rag_chatbot import RAGChatbot
+from ingest_jobs import IngestJobManager, COMPLETED, FAILED
 import config
 
 # Page configuration
@@ -16,12 +18,31 @@ st.set_page_config(
 def initialize_chatbot():
     return RAGChatbot()
 
+@st.cache_resource
+def initialize_job_manager():
+    return IngestJobManager(initialize_chatbot(), max_workers=config.INGEST_WORKERS)
+
+def render_sources(chatbot, sources):
+    """Render compact source references, slicing previews from the chunk store."""
+    for i, source in enumerate(sources):
+        page = f" (page {source['page']})" if source.get('page') else ""
+        st.markdown(f"**Source {i+1}{page}:**")
+        preview = chatbot.get_source_preview(source)
+        if preview is None:
+            st.caption("This source belongs to a document that has since been replaced.")
+        else:
+            st.text(preview)
+        if source["relevance_score"]:
+            st.caption(f"Relevance: {source['relevance_score']:.3f}")
+        st.divider()
+
 def main():
     st.title(" Event Q&A Chatbot")
     st.markdown("Upload an event PDF and ask questions about speakers, sessions, agenda, and more!")
     
     # Initialize chatbot
     chatbot = initialize_chatbot()
+    job_manager = initialize_job_manager()
     
     # Sidebar for document upload
     with st.sidebar:
@@ -34,14 +55,32 @@ def main():
         
         if uploaded_file is not None:
             if st.button("Process Document", type="primary"):
-                with st.spinner("Processing document..."):
-                    result = chatbot.process_document(uploaded_file)
-                
-                if result['success']:
-                    st.success(result['message'])
-                    st.info(f" **Statistics:**\n- Chunks created: {result['chunks_count']}\n- Total words: {result['total_words']}")
-                else:
-                    st.error(result['message'])
+                st.session_state.ingest_job_id = job_manager.submit(
+                    uploaded_file.getvalue(), uploaded_file.name
+                )
+        
+        # Prebuilt index loaded at startup
+        archive_result = chatbot.archive_load_result
+        if archive_result is not None and "ingest_job_id" not in st.session_state:
+            if archive_result['success']:
+                st.success(archive_result['message'])
+            else:
+                st.error(archive_result['message'])
+        
+        # Ingest job status; questions keep using the previous document meanwhile
+        job = None
+        if "ingest_job_id" in st.session_state:
+            job = job_manager.get_job(st.session_state.ingest_job_id)
+        
+        if job is not None:
+            if job['status'] == COMPLETED:
+                result = job['result']
+                st.success(result['message'])
+                st.info(f" **Statistics:**\n- Chunks created: {result['chunks_count']}\n- Total words: {result['total_words']}\n- Sessions indexed: {result['sessions_count']}\n- Speakers indexed: {result['speakers_count']}")
+            elif job['status'] == FAILED:
+                st.error(job['message'])
+            else:
+                st.progress(job['progress'], text=f"{job['filename']}: {job['message']}")
         
         # LLM Status
         st.header("🔧 System Status")
@@ -50,6 +89,25 @@ def main():
         else:
             st.error(" Ollama LLM Unavailable")
             st.info("Please ensure Ollama is running with Mistral model")
+        
+        stats = chatbot.get_generation_stats()
+        st.caption(
+            f"Generations: {stats['active']}/{stats['max_concurrent']} active, "
+            f"{stats['queue_depth']} queued"
+        )
+        
+        endpoints = chatbot.llm.get_stats()
+        if len(endpoints) > 1:
+            healthy = sum(1 for ep in endpoints if ep['healthy'])
+            st.caption(f"LLM endpoints: {healthy}/{len(endpoints)} healthy")
+        
+        extractive = chatbot.get_extractive_stats()
+        if extractive and extractive['attempts']:
+            st.caption(
+                f"Fast-path answers: {extractive['hit_rate']:.0%} of "
+                f"{extractive['attempts']} questions, "
+                f"{extractive['avg_latency_ms']:.1f} ms avg"
+            )
     
     # Main chat interface
     st.header(" Ask Questions")
@@ -58,8 +116,18 @@ def main():
     if "messages" not in st.session_state:
         st.session_state.messages = []
     
+    if "history_visible" not in st.session_state:
+        st.session_state.history_visible = config.HISTORY_PAGE_SIZE
+    
+    # Display only the most recent turns; older ones are paged in on request
+    hidden = max(0, len(st.session_state.messages) - st.session_state.history_visible)
+    if hidden:
+        if st.button(f"Show earlier messages ({hidden} hidden)"):
+            st.session_state.history_visible += config.HISTORY_PAGE_SIZE
+            st.rerun()
+    
     # Display chat history
-    for message in st.session_state.messages:
+    for message in st.session_state.messages[hidden:]:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
             
@@ -67,12 +135,7 @@ def main():
             if message["role"] == "assistant" and "sources" in message:
                 if message["sources"]:
                     with st.expander(" Sources"):
-                        for i, source in enumerate(message["sources"]):
-                            st.markdown(f"**Source {i+1}:**")
-                            st.text(source["text_preview"])
-                            if source["relevance_score"]:
-                                st.caption(f"Relevance: {source['relevance_score']:.3f}")
-                            st.divider()
+                        render_sources(chatbot, message["sources"])
     
     # Chat input
     if prompt := st.chat_input("Ask about the event..."):
@@ -89,17 +152,15 @@ def main():
                 response = chatbot.answer_question(prompt)
             
             if response['success']:
-                st.markdown(response['answer'])
+                if response.get('degraded'):
+                    st.warning(response['answer'])
+                else:
+                    st.markdown(response['answer'])
                 
                 # Show sources
                 if response['sources']:
                     with st.expander(" Sources"):
-                        for i, source in enumerate(response['sources']):
-                            st.markdown(f"**Source {i+1}:**")
-                            st.text(source["text_preview"])
-                            if source["relevance_score"]:
-                                st.caption(f"Relevance: {source['relevance_score']:.3f}")
-                            st.divider()
+                        render_sources(chatbot, response['sources'])
                 
                 # Add assistant message to chat history
                 st.session_state.messages.append({
@@ -133,6 +194,11 @@ def main():
         - When is the [Session Name] session?
         - What are the workshop topics?
         """)
+    
+    # Poll the running ingest job once the page has rendered
+    if job is not None and job['status'] not in (COMPLETED, FAILED):
+        time.sleep(config.INGEST_POLL_INTERVAL)
+        st.rerun()
 
 if __name__ == "__main__":
     main()
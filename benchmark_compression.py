@@ -0,0 +1,136 @@
+"""Measure recall vs. memory of vector compression settings on an event PDF.
+
+Usage:
+    python generate_sample_pdf.py
+    python benchmark_compression.py sample_event_comprehensive.pdf
+
+Each setting is loaded into a real ``VectorStore`` (in a temporary
+directory) and queried through ``search_similar``, so recall and memory
+are those of the shipped store. Recall@k is measured against exact
+full-precision search over the same chunks; "shortlist" is the recall of
+the compressed vectors alone, before full-precision rescoring. Small chunk
+sizes are used by default so the sample document yields enough vectors
+for the numbers to mean something.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import config
+from document_processor import DocumentProcessor
+from vector_store import VectorStore
+from vector_compression import VectorCompressor, CompressedIndex, exact_search, recall_at_k
+
+EXAMPLE_QUESTIONS = [
+    "Who are the keynote speakers?",
+    "When is the RAG workshop?",
+    "Which room is the LLM fine-tuning workshop in?",
+    "What hotels have conference rates?",
+    "Who moderates the ethics panel?",
+    "How do I get to the venue by public transport?",
+    "Who are the platinum sponsors?",
+    "What are the prerequisites for the workshops?",
+]
+
+DIMENSIONS = [384, 256, 128, 64, 32]
+QUANTIZATIONS = [None, 'int8']
+
+
+def build_queries(chunks, per_chunk_words=(10, 25)):
+    """Example questions plus a mid-chunk snippet from every chunk."""
+    start, end = per_chunk_words
+    snippets = [' '.join(c['text'].split()[start:end]) for c in chunks]
+    return EXAMPLE_QUESTIONS + [s for s in snippets if s]
+
+
+def run_benchmark(pdf_path, chunk_size, chunk_overlap, top_k, rescore_factor, method, projected_vectors):
+    processor = DocumentProcessor(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    with open(pdf_path, 'rb') as f:
+        chunks = processor.chunk_text(processor.extract_text_from_pdf(f))
+    queries = build_queries(chunks)
+
+    # One Chroma database per setting, removed when the run ends
+    with tempfile.TemporaryDirectory(prefix='compression_benchmark_', ignore_cleanup_errors=True) as workdir:
+        _run_settings(workdir, chunks, queries, top_k, rescore_factor, method, projected_vectors)
+
+
+def _run_settings(workdir, chunks, queries, top_k, rescore_factor, method, projected_vectors):
+    """Load every setting into its own VectorStore under ``workdir`` and print a row per setting."""
+    baseline = VectorStore(os.path.join(workdir, 'baseline'), 'benchmark', config.EMBEDDING_MODEL)
+    embeddings = baseline.embed_chunks(chunks)
+    query_embeddings = np.asarray(baseline.embedding_model.encode(queries), dtype=np.float32)
+    full_dimension = embeddings.shape[1]
+
+    k = min(top_k, len(chunks))
+    expected = [exact_search(embeddings, q, k) for q in query_embeddings]
+    full_bytes = VectorStore.bytes_per_vector(full_dimension)['stored_bytes_per_vector']
+
+    print(f"{len(chunks)} chunks, {len(queries)} queries, recall@{k}, "
+          f"shortlist {rescore_factor}x, method={method}")
+    print(f"Vector bytes held by VectorStore (Chroma float32 + in-memory int8 codes), "
+          f"projected for {projected_vectors:,} vectors; HNSW graph overhead and the "
+          f"memory-mapped rescoring vectors are not included\n")
+    print(f"{'dims':>5} {'quant':>6} {'chroma':>7} {'codes':>6} {'B/vec':>6} {'MiB':>8} {'ratio':>6} "
+          f"{'shortlist':>10} {'served':>7} {'ms/query':>9}")
+
+    for dimensions in DIMENSIONS:
+        if dimensions > full_dimension:
+            continue
+        for quantization in QUANTIZATIONS:
+            compressed = dimensions < full_dimension or quantization is not None
+            if compressed:
+                name = f"d{dimensions}_{quantization or 'float'}"
+                store = VectorStore(
+                    os.path.join(workdir, name), 'benchmark', baseline.embedding_model,
+                    reduced_dimension=dimensions, reduction_method=method,
+                    quantization=quantization, rescore_factor=rescore_factor
+                )
+            else:
+                store = baseline
+            _, collection = store.build_collection(chunks, embeddings=embeddings)
+
+            # Ranking by the compressed vectors alone, before rescoring
+            shortlist = '-'
+            if compressed:
+                compressor = VectorCompressor(
+                    dimensions=dimensions, method=method, quantization=quantization
+                ).fit(embeddings)
+                index = CompressedIndex.build(compressor, embeddings)
+                plain = [index.search(q, k, rescore=False)[0] for q in query_embeddings]
+                shortlist = f"{recall_at_k(plain, expected):.3f}"
+
+            start = time.perf_counter()
+            results = [store.search_similar(q, top_k=k, collection=collection) for q in queries]
+            elapsed_ms = 1000 * (time.perf_counter() - start) / len(queries)
+            served = [np.array([r['metadata']['chunk_id'] for r in result]) for result in results]
+
+            sizes = VectorStore.bytes_per_vector(dimensions, quantization)
+            stats = store.get_compression_stats(collection)
+            if stats is not None:
+                sizes = {key: stats[key] for key in sizes}
+            bytes_per_vector = sizes['stored_bytes_per_vector']
+            print(f"{dimensions:>5} {quantization or '-':>6} {sizes['chroma_bytes_per_vector']:>7} "
+                  f"{sizes['codes_bytes_per_vector']:>6} {bytes_per_vector:>6} "
+                  f"{bytes_per_vector * projected_vectors / 2**20:>8.1f} "
+                  f"{full_bytes / bytes_per_vector:>5.1f}x "
+                  f"{shortlist:>10} {recall_at_k(served, expected):>7.3f} {elapsed_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('pdf', nargs='?', default='sample_event_comprehensive.pdf')
+    parser.add_argument('--chunk-size', type=int, default=60)
+    parser.add_argument('--chunk-overlap', type=int, default=15)
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--rescore-factor', type=int, default=config.RESCORE_CANDIDATES_FACTOR)
+    parser.add_argument('--method', choices=['pca', 'truncate'], default=config.VECTOR_REDUCTION_METHOD)
+    parser.add_argument('--projected-vectors', type=int, default=300_000,
+                        help="Corpus size used to project memory use")
+    args = parser.parse_args()
+
+    run_benchmark(args.pdf, args.chunk_size, args.chunk_overlap, args.top_k,
+                  args.rescore_factor, args.method, args.projected_vectors)
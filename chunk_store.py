@@ -0,0 +1,67 @@
+"""Compact in-memory storage of document chunks as offsets into one text."""
+
+import bisect
+import re
+from array import array
+from typing import List, Dict, Optional, Tuple
+
+PAGE_MARKER_PATTERN = re.compile(r'--- Page (\d+) ---')
+
+
+def page_lookup(text: str):
+    """Return a function mapping a character offset to its page number."""
+    markers = [(m.start(), int(m.group(1))) for m in PAGE_MARKER_PATTERN.finditer(text)]
+    positions = [pos for pos, _ in markers]
+
+    def page_at(offset: int) -> Optional[int]:
+        i = bisect.bisect_right(positions, offset) - 1
+        return markers[i][1] if i >= 0 else None
+
+    return page_at
+
+
+class ChunkStore:
+    """Chunks of one document, stored as offsets into the shared document text.
+
+    Overlapping chunks share the same underlying string, so the store costs
+    roughly one copy of the document plus a few bytes per chunk. Chunk text
+    and previews are sliced on demand.
+    """
+
+    def __init__(self, text: str, chunks: List[Dict[str, any]]):
+        self.text = text
+        self._starts = array('l', (c['metadata']['start_char'] for c in chunks))
+        self._ends = array('l', (c['metadata']['end_char'] for c in chunks))
+        self._pages = array('l', (c['metadata'].get('page') or 0 for c in chunks))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def get_text(self, chunk_id: int) -> str:
+        return self.text[self._starts[chunk_id]:self._ends[chunk_id]]
+
+    def get_page(self, chunk_id: int) -> Optional[int]:
+        return self._pages[chunk_id] or None
+
+    def get_span(self, chunk_id: int) -> Tuple[int, int]:
+        """``(start_char, end_char)`` of a chunk in the document text."""
+        return self._starts[chunk_id], self._ends[chunk_id]
+
+    def chunk_at(self, offset: int) -> Optional[int]:
+        """The chunk starting closest before ``offset`` that contains it."""
+        i = bisect.bisect_right(self._starts, offset) - 1
+        if i >= 0 and offset < self._ends[i]:
+            return i
+        return None
+
+    def preview(self, chunk_id: int, length: int = 200) -> str:
+        """First ``length`` characters of a chunk."""
+        start, end = self._starts[chunk_id], self._ends[chunk_id]
+        if end - start > length:
+            return self.text[start:start + length] + '...'
+        return self.text[start:end]
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the text and offset arrays."""
+        offsets = sum(a.itemsize * len(a) for a in (self._starts, self._ends, self._pages))
+        return len(self.text.encode('utf-8')) + offsets
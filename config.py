@@ -10,14 +10,49 @@ COLLECTION_NAME = "event_documents"
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 EMBEDDING_DIMENSION = 384
 
+# Vector Compression Configuration (see benchmark_compression.py)
+VECTOR_REDUCED_DIMENSION = None  # e.g. 128; None keeps EMBEDDING_DIMENSION
+VECTOR_REDUCTION_METHOD = "pca"  # "pca" or "truncate" (Matryoshka-style prefix)
+VECTOR_QUANTIZATION = None  # None or "int8"
+RESCORE_CANDIDATES_FACTOR = 4  # Shortlist size as a multiple of top_k
+
 # Text Processing Configuration
 CHUNK_SIZE = 500
 CHUNK_OVERLAP = 50
 
+# Index Archive Configuration (see index_archive.py)
+INDEX_ARCHIVE_PATH = None  # e.g. "./event_index.zip", loaded at startup when present
+
+# Ingest Configuration
+INGEST_WORKERS = 1
+INGEST_POLL_INTERVAL = 1.0
+
+# Structured Event Index Configuration
+EVENT_INDEX_ENABLED = True
+EVENT_INDEX_PATH = "./event_index.db"
+
+# Extractive Answer Configuration
+EXTRACTIVE_ANSWERS_ENABLED = True
+EXTRACTIVE_CONFIDENCE_THRESHOLD = 0.6
+
 # LLM Configuration
 OLLAMA_BASE_URL = "http://127.0.0.1:11434"
 DEFAULT_MODEL = "mistral"
+LLM_REQUEST_TIMEOUT = 300
+
+# LLM Routing Configuration
+OLLAMA_ENDPOINTS = [OLLAMA_BASE_URL]
+FAST_MODEL = None  # e.g. "phi3:mini" for short factual questions
+FAST_QUESTION_MAX_WORDS = 12
+ENDPOINT_FAILURE_THRESHOLD = 2
+ENDPOINT_COOLDOWN = 30.0
+
+# Generation Scheduling Configuration
+MAX_CONCURRENT_GENERATIONS = 2
+GENERATION_QUEUE_WAIT = 30.0
+GENERATION_QUEUE_SIZE = 32
 
 # Streamlit Configuration
 PAGE_TITLE = "Event Q&A Chatbot"
 PAGE_ICON = "Chat"
+HISTORY_PAGE_SIZE = 20  # Chat messages rendered before "Show earlier messages"
@@ -3,6 +3,7 @@
 import PyPDF2
 from typing import List, Dict
 import re
+from chunk_store import page_lookup
 
 class DocumentProcessor:
     """Handles PDF text extraction and document chunking."""
@@ -13,46 +14,60 @@ class DocumentProcessor:
     
     def extract_text_from_pdf(self, pdf_file) -> str:
         """Extract text from uploaded PDF file."""
+        return self.pages_to_text(self.extract_pages_from_pdf(pdf_file))
+    
+    def extract_pages_from_pdf(self, pdf_file) -> List[str]:
+        """Extract the raw text of each page, keeping line breaks."""
         try:
             pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            
-            for page_num, page in enumerate(pdf_reader.pages):
-                page_text = page.extract_text()
-                # print("-------------->",page_text)
-                if page_text.strip():
-                    text += f"\n--- Page {page_num + 1} ---\n"
-                    text += page_text
-            
-            return self._clean_text(text)
+            return [page.extract_text() or "" for page in pdf_reader.pages]
         
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
     
+    def pages_to_text(self, pages: List[str]) -> str:
+        """Join raw page texts with page markers and clean the result."""
+        text = ""
+        
+        for page_num, page_text in enumerate(pages):
+            if page_text.strip():
+                text += f"\n--- Page {page_num + 1} ---\n"
+                text += page_text
+        
+        return self._clean_text(text)
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
         # Remove excessive whitespace
         text = re.sub(r'\s+', ' ', text)
         # Remove special characters that might interfere
         text = re.sub(r'[^\w\s\-.,!?;:()\[\]"]', '', text)
+        # Collapse spaces left behind by removed characters, so that joined
+        # chunk words are exact slices of the text
+        text = re.sub(r' {2,}', ' ', text)
         return text.strip()
     
     def chunk_text(self, text: str) -> List[Dict[str, any]]:
         """Split text into overlapping chunks for better retrieval."""
-        words = text.split()
+        word_spans = [m.span() for m in re.finditer(r'\S+', text)]
+        words = [text[start:end] for start, end in word_spans]
+        page_at = page_lookup(text)
         chunks = []
         
         for i in range(0, len(words), self.chunk_size - self.chunk_overlap):
             chunk_words = words[i:i + self.chunk_size]
             chunk_text = ' '.join(chunk_words)
+            end_word = min(i + self.chunk_size, len(words))
             
             # Create metadata for each chunk
             chunk_metadata = {
                 'chunk_id': len(chunks),
                 'start_word': i,
-                'end_word': min(i + self.chunk_size, len(words)),
-                'word_count': len(chunk_words)
+                'end_word': end_word,
+                'word_count': len(chunk_words),
+                'start_char': word_spans[i][0],
+                'end_char': word_spans[end_word - 1][1],
+                'page': page_at(word_spans[i][0]) or 0
             }
             
             chunks.append({
@@ -0,0 +1,351 @@
+"""Structured index of sessions and speakers extracted from event documents."""
+
+import json
+import os
+import re
+import sqlite3
+from typing import List, Dict, Optional, Tuple
+
+from extractive_answerer import (
+    ExtractiveAnswerer, parse_sessions, PERSON_FIELDS, PERSON_INTENT, LOCATION_INTENT, TIME_INTENT
+)
+
+DAY_HEADER_PATTERN = re.compile(r'^\s*Day (\d+)\s*-\s*(.+?)\s*$', re.MULTILINE)
+HONORIFIC_PATTERN = re.compile(r'\b(?:Dr|Prof|Professor|Mr|Mrs|Ms)\.?\s+[A-Z]')
+PAGE_FOOTER_PATTERN = re.compile(r'^Page \d+$')
+PAREN_PATTERN = re.compile(r'\s*\(([^)]*)\)')
+PROFILE_QUESTION_PATTERN = re.compile(r'\b(who is|tell me about|background|bio|profile)\b')
+DAY_QUESTION_PATTERN = re.compile(r'\bday (\d+)\b')
+LISTING_QUESTION_PATTERN = re.compile(r'\b(agenda|schedule|sessions|program|programme)\b')
+
+SCHEMA = """
+CREATE TABLE sessions (
+    id INTEGER PRIMARY KEY,
+    day TEXT,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    title TEXT NOT NULL,
+    location TEXT,
+    description TEXT,
+    fields TEXT NOT NULL
+);
+CREATE TABLE speakers (
+    name TEXT PRIMARY KEY,
+    display_name TEXT NOT NULL,
+    title TEXT,
+    organization TEXT,
+    bio TEXT
+);
+CREATE TABLE session_speakers (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    speaker_name TEXT NOT NULL REFERENCES speakers(name),
+    role TEXT NOT NULL
+);
+"""
+
+
+def _name_key(name: str) -> str:
+    """Normalise a person's name for matching, dropping honorifics."""
+    name = re.sub(r'^(?:Dr|Prof|Professor|Mr|Mrs|Ms)\.?\s+', '', name.strip())
+    return ' '.join(name.lower().split())
+
+
+def parse_people(value: str) -> List[Tuple[str, Optional[str]]]:
+    """Split a field such as ``Dr. A B (Org), C D`` into ``(name, organization)`` pairs.
+
+    Items that do not look like a person's name, e.g. "Multiple researchers",
+    are skipped.
+    """
+    people = []
+    for item in re.split(r',|&|\band\b', value):
+        org_match = PAREN_PATTERN.search(item)
+        organization = org_match.group(1).strip() if org_match else None
+        name = PAREN_PATTERN.sub('', item).strip()
+
+        # "Conference Chair Dr. James Wilson" -> "Dr. James Wilson"
+        honorific = HONORIFIC_PATTERN.search(name)
+        if honorific:
+            name = name[honorific.start():]
+
+        words = name.split()
+        if not 2 <= len(words) <= 5 or not all(w[0].isupper() for w in words):
+            continue
+        people.append((name, organization))
+    return people
+
+
+def parse_speaker_profiles(page_text: str) -> List[Dict[str, str]]:
+    """Parse speaker profiles laid out as name, ``Title:``, ``Organization:``, bio."""
+    lines = [line.strip() for line in page_text.splitlines()]
+    title_rows = [i for i, line in enumerate(lines) if line.startswith('Title:') and i > 0]
+    profiles = []
+
+    for n, row in enumerate(title_rows):
+        if row + 1 >= len(lines) or not lines[row + 1].startswith('Organization:'):
+            continue
+        # The bio runs until the name line of the next profile
+        bio_end = title_rows[n + 1] - 1 if n + 1 < len(title_rows) else len(lines)
+        profiles.append({
+            'name': lines[row - 1],
+            'title': lines[row][len('Title:'):].strip(),
+            'organization': lines[row + 1][len('Organization:'):].strip(),
+            'bio': ' '.join(line for line in lines[row + 2:bio_end] if line)
+        })
+    return profiles
+
+
+def strip_page_furniture(pages: List[str]) -> List[str]:
+    """Drop page-number footers and running headers repeated on most pages."""
+    page_lines = [[line.strip() for line in page.splitlines() if line.strip()] for page in pages]
+    repeated = set()
+    if len(pages) > 1:
+        counts = {}
+        for lines in page_lines:
+            # Only the edges of a page can hold headers and footers
+            for line in set(lines[:2] + lines[-2:]):
+                counts[line] = counts.get(line, 0) + 1
+        repeated = {line for line, count in counts.items() if count > len(pages) / 2}
+
+    return [
+        '\n'.join(
+            line for line in lines
+            if line not in repeated and not PAGE_FOOTER_PATTERN.match(line)
+        )
+        for lines in page_lines
+    ]
+
+
+def extract_event_structure(pages: List[str]) -> Tuple[List[Dict[str, str]], Dict[str, Dict[str, str]]]:
+    """Extract sessions and speaker profiles from raw page texts."""
+    pages = strip_page_furniture(pages)
+    full_text = '\n'.join(pages)
+
+    # Sessions, tagged with the agenda day they appear under
+    sessions = []
+    headers = list(DAY_HEADER_PATTERN.finditer(full_text))
+    segments = [(None, full_text[:headers[0].start()] if headers else full_text)]
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(full_text)
+        day = f"Day {header.group(1)} ({header.group(2)})"
+        segments.append((day, full_text[header.end():end]))
+
+    for day, segment in segments:
+        for session in parse_sessions(' '.join(segment.split())):
+            if day:
+                session['day'] = day
+            sessions.append(session)
+
+    # Speakers from profile blocks, then from session fields
+    speakers = {}
+    for page in pages:
+        for profile in parse_speaker_profiles(page):
+            speakers[_name_key(profile['name'])] = profile
+
+    for session in sessions:
+        session['people'] = []
+        for role in PERSON_FIELDS:
+            for name, organization in parse_people(session.get(role, '')):
+                key = _name_key(name)
+                profile = speakers.setdefault(key, {
+                    'name': name, 'title': None, 'organization': organization, 'bio': None
+                })
+                if not profile['organization'] and organization:
+                    profile['organization'] = organization
+                session['people'].append((key, role))
+
+    return sessions, speakers
+
+
+def locate_session(text: str, session: Dict[str, str]) -> Optional[int]:
+    """Character offset of a session's agenda entry in the document text.
+
+    Among the entries with the session's time range, the one followed by the
+    most words of its title is chosen.
+    """
+    pattern = re.compile(rf"{re.escape(session['start'])}\s*-\s*{re.escape(session['end'])}", re.IGNORECASE)
+    title_words = set(re.findall(r'[a-z0-9]+', session['title'].lower()))
+    best = None
+    for match in pattern.finditer(text):
+        following = text[match.end():match.end() + len(session['title']) + 20].lower()
+        score = len(title_words & set(re.findall(r'[a-z0-9]+', following)))
+        if best is None or score > best[0]:
+            best = (score, match.start())
+    return best[1] if best else None
+
+
+def locate_speaker_profile(text: str, speaker: Dict[str, any]) -> Optional[int]:
+    """Character offset of a speaker's profile block, if the document has one."""
+    match = re.search(rf"{re.escape(speaker['name'])}\s+Title:", text)
+    return match.start() if match else None
+
+
+def versioned_path(base_path: str, version: int) -> str:
+    """Database path for one index version, e.g. ``event_index_v3.db``."""
+    root, ext = os.path.splitext(base_path)
+    return f"{root}_v{version}{ext}"
+
+
+class EventIndex:
+    """SQLite-backed index of sessions and speakers for instant lookups.
+
+    An instance is a read-only view of one database; ``build`` writes a new
+    database and returns a new instance, so rebuilding never changes what
+    existing readers see. Lookups are served from an in-memory copy.
+    """
+
+    def __init__(self, db_path: str, confidence_threshold: float = 0.6):
+        self.db_path = db_path
+        self.session_matcher = ExtractiveAnswerer(confidence_threshold=confidence_threshold)
+
+        # (sessions, speakers)
+        self._data = ([], {})
+        if os.path.exists(db_path):
+            self._load()
+
+    @classmethod
+    def build(cls, db_path: str, pages: List[str], confidence_threshold: float = 0.6) -> 'EventIndex':
+        """Extract the structured index from raw page texts and persist it to ``db_path``."""
+        sessions, speakers = extract_event_structure(pages)
+
+        # Write to a temporary file first so a crash never leaves a partial index
+        tmp_path = f"{db_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.executescript(SCHEMA)
+            conn.executemany(
+                "INSERT INTO speakers VALUES (?, ?, ?, ?, ?)",
+                [(key, p['name'], p['title'], p['organization'], p['bio'])
+                 for key, p in speakers.items()]
+            )
+            for session_id, session in enumerate(sessions):
+                conn.execute(
+                    "INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (session_id, session.get('day'), session['start'], session['end'],
+                     session['title'], session.get('location'), session.get('description'),
+                     json.dumps({k: v for k, v in session.items() if k != 'people'}))
+                )
+                conn.executemany(
+                    "INSERT INTO session_speakers VALUES (?, ?, ?)",
+                    [(session_id, key, role) for key, role in dict.fromkeys(session['people'])]
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+        os.replace(tmp_path, db_path)
+        return cls(db_path, confidence_threshold=confidence_threshold)
+
+    def counts(self) -> Dict[str, int]:
+        sessions, speakers = self._data
+        return {'sessions': len(sessions), 'speakers': len(speakers)}
+
+    def remove(self) -> None:
+        """Delete the backing database file."""
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def is_empty(self) -> bool:
+        sessions, speakers = self._data
+        return not sessions and not speakers
+
+    def get_sessions(self, day: Optional[str] = None) -> List[Dict[str, str]]:
+        """All sessions, optionally only those on a given day number."""
+        sessions = self._data[0]
+        if day is not None:
+            sessions = [s for s in sessions if (s.get('day') or '').startswith(f"Day {day} ")]
+        return sessions
+
+    def get_speaker(self, name: str) -> Optional[Dict[str, any]]:
+        """Speaker profile with the sessions they take part in."""
+        return self._data[1].get(_name_key(name))
+
+    def lookup(self, question: str) -> Optional[Dict[str, any]]:
+        """Answer schedule and speaker questions straight from the index."""
+        sessions, speakers = self._data
+        if not sessions and not speakers:
+            return None
+
+        lowered = question.lower()
+
+        speaker = self._find_speaker(lowered, speakers)
+        if speaker is not None and PROFILE_QUESTION_PATTERN.search(lowered):
+            return {'answer': self._format_profile(speaker), 'speaker': speaker}
+
+        day_match = DAY_QUESTION_PATTERN.search(lowered)
+        if day_match and LISTING_QUESTION_PATTERN.search(lowered):
+            day_sessions = self.get_sessions(day=day_match.group(1))
+            if day_sessions:
+                lines = [f"- {s['start']} - {s['end']}: {s['title']}" for s in day_sessions]
+                return {'answer': f"{day_sessions[0]['day']}:\n" + '\n'.join(lines)}
+
+        matched = self.session_matcher.answer_from_sessions(question, sessions)
+        if matched is not None:
+            return matched
+
+        # Only list a speaker's sessions when the question asks about their schedule
+        if speaker is not None and speaker['sessions'] and self._asks_schedule(lowered):
+            lines = [
+                f"- {s['title']} ({s['start']} - {s['end']}"
+                + (f", {s['day']}" if s.get('day') else '')
+                + (f", {s['location']}" if s.get('location') else '') + ")"
+                for s in speaker['sessions']
+            ]
+            return {'answer': f"{speaker['name']} is part of:\n" + '\n'.join(lines), 'speaker': speaker}
+
+        return None
+
+    def _asks_schedule(self, question: str) -> bool:
+        return any(
+            pattern.search(question)
+            for pattern in (PERSON_INTENT, LOCATION_INTENT, TIME_INTENT, LISTING_QUESTION_PATTERN)
+        )
+
+    def _find_speaker(self, question: str, speakers: Dict[str, Dict[str, any]]) -> Optional[Dict[str, any]]:
+        """Speaker whose full or last name appears in the question."""
+        for key, speaker in speakers.items():
+            if key in question:
+                return speaker
+        for key, speaker in speakers.items():
+            last_name = key.split()[-1]
+            if re.search(rf"\b{re.escape(last_name)}\b", question):
+                return speaker
+        return None
+
+    def _format_profile(self, speaker: Dict[str, any]) -> str:
+        role = ', '.join(p for p in (speaker['title'], speaker['organization']) if p)
+        answer = speaker['name'] + (f" - {role}" if role else '')
+        if speaker['bio']:
+            answer += f"\n\n{speaker['bio']}"
+        if speaker['sessions']:
+            titles = '; '.join(f"{s['title']} ({s['start']})" for s in speaker['sessions'])
+            answer += f"\n\nSessions: {titles}"
+        return answer
+
+    def _load(self) -> None:
+        """Load the persisted index into memory and publish it."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            session_rows = conn.execute("SELECT id, fields FROM sessions ORDER BY id").fetchall()
+            speaker_rows = conn.execute(
+                "SELECT name, display_name, title, organization, bio FROM speakers"
+            ).fetchall()
+            link_rows = conn.execute(
+                "SELECT session_id, speaker_name, role FROM session_speakers"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        sessions_by_id = {row[0]: json.loads(row[1]) for row in session_rows}
+        speakers = {
+            name: {'name': display, 'title': title, 'organization': org,
+                   'bio': bio, 'sessions': []}
+            for name, display, title, org, bio in speaker_rows
+        }
+        for session_id, speaker_name, role in link_rows:
+            if speaker_name in speakers and session_id in sessions_by_id:
+                speakers[speaker_name]['sessions'].append(sessions_by_id[session_id])
+
+        self._data = (list(sessions_by_id.values()), speakers)
@@ -0,0 +1,236 @@
+"""Pattern-based extractive answers for simple schedule lookups."""
+
+import math
+import re
+import threading
+import time
+from typing import List, Dict, Optional
+
+TIME_RANGE_PATTERN = re.compile(
+    r'(\d{1,2}:\d{2}\s*[AP]M)\s*-\s*(\d{1,2}:\d{2}\s*[AP]M)\s*:?', re.IGNORECASE
+)
+FIELD_PATTERN = re.compile(
+    r'\b(Speakers?|Instructor|Moderator|Panelists|Location|Description|Prerequisites)\s*:'
+)
+# Text that starts a new section rather than continuing the current session
+SECTION_BOUNDARY_PATTERN = re.compile(
+    r'---\s*Page \d+\s*---|\bPage \d+\b|\bDay \d+\s*-|\b[A-Z][a-z]+ \d+:|\b[A-Z]{3,}(?: [A-Z&]{2,})+\b'
+)
+
+PERSON_FIELDS = ('speaker', 'speakers', 'instructor', 'moderator', 'panelists')
+
+TIME_INTENT = re.compile(r'\b(what time|when|start|starts|begin|begins|end|ends|schedule[d]?)\b')
+LOCATION_INTENT = re.compile(r'\b(where|which room|what room|room|location|held)\b')
+PERSON_INTENT = re.compile(r'\b(who|speaker|speaking|instructor|presenter|presenting|moderator|teach|teaching|lead|leading)\b')
+
+STOPWORDS = {
+    'a', 'an', 'the', 'is', 'are', 'was', 'of', 'on', 'in', 'at', 'for', 'to', 'and',
+    'what', 'when', 'where', 'who', 'which', 'time', 'does', 'do', 'will', 'be', 'it',
+    'room', 'session', 'start', 'starts', 'begin', 'begins', 'end', 'ends', 'held',
+    'location', 'speaker', 'speaking', 'instructor', 'presenter', 'presenting',
+    'moderator', 'teach', 'teaching', 'lead', 'leading', 'about', 'scheduled', 'schedule',
+    'moderates', 'teaches', 'leads', 'speaks', 'presents', 'happen', 'happens'
+}
+
+
+def _tokens(text: str) -> List[str]:
+    return re.findall(r'[a-z0-9]+', text.lower())
+
+
+def parse_sessions(text: str) -> List[Dict[str, str]]:
+    """Parse agenda entries such as ``9:00 AM - 10:00 AM: Title Location: Room``.
+
+    Works on the whitespace-collapsed text produced by ``DocumentProcessor``.
+    Each session has ``start``, ``end`` and ``title`` plus any labelled fields
+    (``speaker``, ``instructor``, ``location``, ...) found in the entry.
+    """
+    matches = list(TIME_RANGE_PATTERN.finditer(text))
+    sessions = []
+
+    for i, match in enumerate(matches):
+        body_end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        body = text[match.end():body_end]
+
+        # Stop at the first field value that runs into a new section
+        fields = {}
+        parts = FIELD_PATTERN.split(body)
+        title = parts[0]
+        for label, value in zip(parts[1::2], parts[2::2]):
+            boundary = SECTION_BOUNDARY_PATTERN.search(value)
+            if boundary:
+                value = value[:boundary.start()]
+            fields.setdefault(label.lower(), ' '.join(value.split()))
+            if boundary:
+                break
+
+        boundary = SECTION_BOUNDARY_PATTERN.search(title)
+        if boundary and boundary.start() > 0:
+            title = title[:boundary.start()]
+
+        session = {
+            'start': ' '.join(match.group(1).upper().split()),
+            'end': ' '.join(match.group(2).upper().split()),
+            'title': ' '.join(title.split()).strip(' -')
+        }
+        session.update({k: v for k, v in fields.items() if v})
+        sessions.append(session)
+
+    return sessions
+
+
+class ExtractiveAnswerer:
+    """Answers time, room and speaker lookups directly from retrieved chunks.
+
+    A question is matched against the agenda entries parsed from the chunks.
+    Time and room questions are matched against session titles only; speaker
+    questions also against the speaker fields. Question keywords are weighted
+    by how rare they are across the sessions, so a word shared by many
+    sessions counts for little. An answer is returned only when one entry
+    clearly matches on two or more keywords (or one keyword unique to it)
+    and carries the requested field; otherwise the caller should fall back
+    to the LLM.
+    """
+
+    def __init__(self, confidence_threshold: float = 0.6):
+        self.confidence_threshold = confidence_threshold
+
+        self._lock = threading.Lock()
+        self._attempts = 0
+        self._hits = 0
+        self._total_latency = 0.0
+        self._hit_latency = 0.0
+
+    def answer(self, question: str, context_chunks: List[Dict[str, any]]) -> Optional[Dict[str, any]]:
+        """Return an extracted answer, or None when confidence is too low."""
+        start = time.perf_counter()
+        result = self._extract(question, context_chunks)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._attempts += 1
+            self._total_latency += elapsed
+            if result is not None:
+                self._hits += 1
+                self._hit_latency += elapsed
+
+        return result
+
+    def get_stats(self) -> Dict[str, any]:
+        """Fast-path hit rate and latency."""
+        with self._lock:
+            return {
+                'attempts': self._attempts,
+                'hits': self._hits,
+                'hit_rate': self._hits / self._attempts if self._attempts else 0.0,
+                'avg_latency_ms': 1000 * self._total_latency / self._attempts if self._attempts else 0.0,
+                'avg_hit_latency_ms': 1000 * self._hit_latency / self._hits if self._hits else 0.0,
+                'confidence_threshold': self.confidence_threshold
+            }
+
+    def _extract(self, question: str, context_chunks: List[Dict[str, any]]) -> Optional[Dict[str, any]]:
+        sessions = []
+        for chunk in context_chunks:
+            sessions.extend(parse_sessions(chunk['text']))
+        return self.answer_from_sessions(question, sessions)
+
+    def answer_from_sessions(self, question: str, sessions: List[Dict[str, str]]) -> Optional[Dict[str, any]]:
+        """Match a question against already parsed sessions.
+
+        Unlike ``answer`` this does not update the fast-path statistics.
+        """
+        lowered = question.lower()
+        intent = self._detect_intent(lowered)
+        if intent is None or not sessions:
+            return None
+
+        keywords = {t for t in _tokens(lowered) if t not in STOPWORDS}
+        if not keywords:
+            return None
+
+        # Overlapping chunks repeat sessions; count each one once
+        unique = {}
+        for session in sessions:
+            unique.setdefault((session.get('day'), session['start'], session['title']), session)
+        sessions = list(unique.values())
+
+        session_tokens = [self._searchable_tokens(intent, session) for session in sessions]
+        document_frequency = {
+            keyword: sum(keyword in tokens for tokens in session_tokens) for keyword in keywords
+        }
+        # Rare keywords weigh most; keywords no session contains weigh as much
+        # as the rarest, so questions about something else don't match
+        weights = {
+            keyword: math.log(1 + len(sessions) / max(df, 1))
+            for keyword, df in document_frequency.items()
+        }
+
+        scored = sorted(
+            (
+                (self._match_score(keywords & tokens, weights, document_frequency), session)
+                for tokens, session in zip(session_tokens, sessions)
+            ),
+            key=lambda item: item[0],
+            reverse=True
+        )
+        best_score, session = scored[0]
+
+        # Penalise ambiguity between different sessions with similar scores
+        runner_up = scored[1][0] if len(scored) > 1 else 0.0
+        confidence = best_score if best_score - runner_up >= 0.25 else best_score / 2
+        if confidence < self.confidence_threshold:
+            return None
+
+        answer = self._format_answer(intent, session)
+        if answer is None:
+            return None
+
+        return {
+            'answer': answer,
+            'confidence': confidence,
+            'session': session
+        }
+
+    def _detect_intent(self, question: str) -> Optional[str]:
+        if PERSON_INTENT.search(question):
+            return 'person'
+        if LOCATION_INTENT.search(question):
+            return 'location'
+        if TIME_INTENT.search(question):
+            return 'time'
+        return None
+
+    def _searchable_tokens(self, intent: str, session: Dict[str, str]) -> set:
+        searchable = [session['title']]
+        if intent == 'person':
+            searchable += [session.get(f, '') for f in PERSON_FIELDS]
+        return set(_tokens(' '.join(searchable)))
+
+    def _match_score(self, matched: set, weights: Dict[str, float],
+                     document_frequency: Dict[str, int]) -> float:
+        """Weighted share of the question's keywords found in a session."""
+        # A single keyword shared with other sessions is too weak to answer from
+        if not matched or (len(matched) == 1 and document_frequency[next(iter(matched))] > 1):
+            return 0.0
+        return sum(weights[k] for k in matched) / sum(weights.values())
+
+    def _format_answer(self, intent: str, session: Dict[str, str]) -> Optional[str]:
+        title = session['title']
+        times = f"{session['start']} - {session['end']}"
+        if session.get('day'):
+            times = f"{times} on {session['day']}"
+
+        if intent == 'time':
+            answer = f"{title} runs from {times}"
+            if session.get('location'):
+                answer += f" in {session['location']}"
+            return answer + "."
+
+        if intent == 'location':
+            if not session.get('location'):
+                return None
+            return f"{title} is in {session['location']} ({times})."
+
+        for field in PERSON_FIELDS:
+            if session.get(field):
+                return f"{title} ({times}) - {field.capitalize()}: {session[field]}."
+        return None
@@ -44,6 +44,19 @@ class EventPDF(FPDF):
         self.multi_cell(0, 6, clean_text)
         self.ln(3)
 
+    def subset_title(self, text):
+        self.set_font('Arial', 'B', 13)
+        self.set_text_color(0, 51, 102)
+        self.multi_cell(0, 8, self.safe_text(text))
+        self.set_text_color(0, 0, 0)
+        self.ln(2)
+
+    def speaker_bio(self, name, title, organization, bio):
+        """Speaker profile laid out as name, Title:, Organization:, bio (parsed by event_index)"""
+        self.set_font('Arial', 'B', 12)
+        self.cell(0, 7, self.safe_text(name), 0, 1)
+        self.body_text(f"Title: {title}\nOrganization: {organization}\n{bio}")
+
 def clean_text_for_pdf(text):
     """Remove or replace Unicode characters that cause encoding issues"""
     # Replace common Unicode characters
@@ -76,12 +89,12 @@ def create_safe_event_pdf():
     event_overview = clean_text_for_pdf('''Welcome to TechConf 2024, the premier AI & Machine Learning Summit bringing together industry leaders, researchers, and innovators from around the globe...''')
     
     pdf.body_text(event_overview)
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-
 def create_event_pdf_reportlab():
+    # reportlab is optional and only needed for this variant
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
     doc = SimpleDocTemplate("sample_event_reportlab.pdf", pagesize=letter)
     styles = getSampleStyleSheet()
     story = []
@@ -0,0 +1,138 @@
+"""Admission control and prioritised queueing for LLM generation requests."""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class GenerationRejected(Exception):
+    """Raised when a generation request cannot be served within its budget."""
+
+    def __init__(self, reason: str, waited: float = 0.0):
+        super().__init__(reason)
+        self.reason = reason
+        self.waited = waited
+
+
+class GenerationScheduler:
+    """Caps concurrent LLM generations and queues the rest by priority.
+
+    Callers block in their own thread until a generation slot is free. Waiting
+    requests are served lowest priority value first, then in arrival order.
+    A request is rejected when the queue is full, when it has waited longer
+    than ``max_queue_wait`` seconds, or when its deadline has passed.
+    """
+
+    def __init__(self, generate_fn: Callable[[str, List[Dict[str, any]]], str],
+                 max_concurrent: int = 2, max_queue_wait: float = 30.0,
+                 max_queue_size: int = 32):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        self.generate_fn = generate_fn
+        self.max_concurrent = max_concurrent
+        self.max_queue_wait = max_queue_wait
+        self.max_queue_size = max_queue_size
+
+        self._condition = threading.Condition()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._active = 0
+
+        self._completed = 0
+        self._rejected = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._max_wait_seen = 0.0
+
+    def submit(self, prompt: str, context_chunks: List[Dict[str, any]],
+               priority: int = 0, deadline: Optional[float] = None) -> str:
+        """Run a generation once a slot is free.
+
+        ``deadline`` is an absolute ``time.monotonic()`` timestamp; the request
+        is rejected instead of started if it cannot begin before then.
+        """
+        waited = self._acquire(priority, deadline)
+        try:
+            result = self.generate_fn(prompt, context_chunks)
+        except Exception:
+            with self._condition:
+                self._failed += 1
+            raise
+        finally:
+            self._release()
+
+        with self._condition:
+            self._completed += 1
+            self._total_wait += waited
+            self._max_wait_seen = max(self._max_wait_seen, waited)
+        return result
+
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        with self._condition:
+            return len(self._waiting)
+
+    def get_stats(self) -> Dict[str, any]:
+        """Snapshot of queue depth, active generations and wait times."""
+        with self._condition:
+            return {
+                'queue_depth': len(self._waiting),
+                'active': self._active,
+                'max_concurrent': self.max_concurrent,
+                'completed': self._completed,
+                'failed': self._failed,
+                'rejected': self._rejected,
+                'avg_wait_seconds': self._total_wait / self._completed if self._completed else 0.0,
+                'max_wait_seconds': self._max_wait_seen
+            }
+
+    def _acquire(self, priority: int, deadline: Optional[float]) -> float:
+        """Block until this request holds a slot; return seconds spent waiting."""
+        start = time.monotonic()
+        give_up_at = start + self.max_queue_wait
+        if deadline is not None:
+            give_up_at = min(give_up_at, deadline)
+
+        with self._condition:
+            if deadline is not None and deadline <= start:
+                self._rejected += 1
+                raise GenerationRejected("Deadline passed before the generation could start.")
+
+            if not self._waiting and self._active < self.max_concurrent:
+                self._active += 1
+                return 0.0
+
+            if len(self._waiting) >= self.max_queue_size:
+                self._rejected += 1
+                raise GenerationRejected("Generation queue is full.")
+
+            entry = [priority, next(self._sequence)]
+            heapq.heappush(self._waiting, entry)
+
+            while not (self._waiting[0] is entry and self._active < self.max_concurrent):
+                remaining = give_up_at - time.monotonic()
+                if remaining <= 0:
+                    self._waiting.remove(entry)
+                    heapq.heapify(self._waiting)
+                    self._rejected += 1
+                    # The head of the queue may have changed
+                    self._condition.notify_all()
+                    raise GenerationRejected(
+                        "Timed out waiting for a free generation slot.",
+                        waited=time.monotonic() - start
+                    )
+                self._condition.wait(timeout=remaining)
+
+            heapq.heappop(self._waiting)
+            self._active += 1
+            self._condition.notify_all()
+            return time.monotonic() - start
+
+    def _release(self) -> None:
+        """Free a slot and wake waiting requests."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
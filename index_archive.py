@@ -0,0 +1,199 @@
+"""Export and load fully built indexes as single versioned archives.
+
+An archive holds the document text, chunks with metadata, full-precision
+embeddings and the structured event index, plus a manifest with checksums
+and a fingerprint of the embedding model. Loading one skips extraction,
+chunking and embedding, so a new replica is ready in seconds.
+
+Usage:
+    python index_archive.py export sample_event_comprehensive.pdf event_index.zip
+    python index_archive.py inspect event_index.zip
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Dict, Tuple
+
+import numpy as np
+
+import config
+
+ARCHIVE_FORMAT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+PROBE_TEXT = "Keynote session in the Main Auditorium at 9:00 AM with Q&A."
+MIN_PROBE_SIMILARITY = 0.999
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def export_index(chatbot, archive_path: str) -> Dict[str, any]:
+    """Write the chatbot's current index to ``archive_path``."""
+    with chatbot.snapshots.acquire() as snapshot:
+        if snapshot is None:
+            raise ValueError("No processed document to export")
+
+        chunks, embeddings = chatbot.vector_store.export_vectors(snapshot.collection)
+        text = snapshot.chunk_store.text
+        event_index_db = None
+        if snapshot.event_index is not None and os.path.exists(snapshot.event_index.db_path):
+            with open(snapshot.event_index.db_path, 'rb') as f:
+                event_index_db = f.read()
+        document_version = snapshot.version
+
+    embeddings_buffer = io.BytesIO()
+    np.save(embeddings_buffer, embeddings.astype(np.float32))
+
+    members = {
+        'document.txt': text.encode('utf-8'),
+        'chunks.json': json.dumps(chunks).encode('utf-8'),
+        'embeddings.npy': embeddings_buffer.getvalue()
+    }
+    if event_index_db is not None:
+        members['event_index.db'] = event_index_db
+
+    manifest = {
+        'format_version': ARCHIVE_FORMAT_VERSION,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'document_version': document_version,
+        'document_sha256': _sha256(members['document.txt']),
+        'chunks_count': len(chunks),
+        'embedding_model': config.EMBEDDING_MODEL,
+        'embedding_fingerprint': chatbot.vector_store.embedding_fingerprint(PROBE_TEXT),
+        'chunking': {'chunk_size': config.CHUNK_SIZE, 'chunk_overlap': config.CHUNK_OVERLAP},
+        'members': {name: _sha256(data) for name, data in members.items()}
+    }
+
+    # Write next to the target and rename, so readers never see a partial archive
+    tmp_path = f"{archive_path}.tmp"
+    with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        for name, data in members.items():
+            archive.writestr(name, data)
+    os.replace(tmp_path, archive_path)
+
+    return {
+        'success': True,
+        'message': f'Exported {len(chunks)} chunks to {archive_path}.',
+        'manifest': manifest
+    }
+
+
+def read_archive(archive_path: str) -> Tuple[Dict[str, any], Dict[str, bytes]]:
+    """Read an archive, checking its format version and member checksums."""
+    with zipfile.ZipFile(archive_path) as archive:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+
+        if manifest.get('format_version') != ARCHIVE_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported archive format {manifest.get('format_version')}, "
+                f"expected {ARCHIVE_FORMAT_VERSION}"
+            )
+
+        members = {}
+        for name, checksum in manifest['members'].items():
+            data = archive.read(name)
+            if _sha256(data) != checksum:
+                raise ValueError(f"Checksum mismatch for {name}; the archive is corrupt")
+            members[name] = data
+
+    return manifest, members
+
+
+def check_fingerprint(manifest: Dict[str, any], vector_store) -> None:
+    """Raise ValueError unless the archive was embedded with the same model."""
+    if manifest['embedding_model'] != config.EMBEDDING_MODEL:
+        raise ValueError(
+            f"Archive was built with {manifest['embedding_model']}, "
+            f"but {config.EMBEDDING_MODEL} is configured"
+        )
+
+    expected = manifest['embedding_fingerprint']
+    actual = vector_store.embedding_fingerprint(expected['probe'])
+    if actual['dimension'] != expected['dimension']:
+        raise ValueError(
+            f"Embedding dimension {actual['dimension']} does not match "
+            f"archive dimension {expected['dimension']}"
+        )
+
+    a = np.asarray(actual['probe_embedding'])
+    b = np.asarray(expected['probe_embedding'])
+    similarity = float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+    if similarity < MIN_PROBE_SIMILARITY:
+        raise ValueError(
+            f"Embedding model weights differ from the archive (probe similarity {similarity:.4f})"
+        )
+
+
+def load_index(chatbot, archive_path: str) -> Dict[str, any]:
+    """Validate an archive and publish it as the chatbot's current index."""
+    manifest, members = read_archive(archive_path)
+    check_fingerprint(manifest, chatbot.vector_store)
+
+    text = members['document.txt'].decode('utf-8')
+    chunks = json.loads(members['chunks.json'])
+    embeddings = np.load(io.BytesIO(members['embeddings.npy']), allow_pickle=False)
+
+    if len(chunks) != manifest['chunks_count'] or len(embeddings) != len(chunks):
+        raise ValueError("Chunk and embedding counts in the archive do not match")
+    if embeddings.shape[1] != manifest['embedding_fingerprint']['dimension']:
+        raise ValueError("Embedding dimension in the archive does not match its manifest")
+
+    result = chatbot.load_prebuilt_index(
+        text, chunks, embeddings, event_index_db=members.get('event_index.db')
+    )
+    result['manifest'] = manifest
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Export or inspect prebuilt index archives.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser('export', help="Process a PDF and export its index")
+    export_parser.add_argument('pdf')
+    export_parser.add_argument('archive')
+
+    inspect_parser = commands.add_parser('inspect', help="Validate an archive and print its manifest")
+    inspect_parser.add_argument('archive')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'inspect':
+        manifest, _ = read_archive(args.archive)
+        print(json.dumps({k: v for k, v in manifest.items() if k != 'embedding_fingerprint'}, indent=2))
+        return 0
+
+    from rag_chatbot import RAGChatbot
+
+    # Build in a scratch directory: ingesting drops every index version this
+    # process doesn't serve, which would include a running app's live index
+    workdir = tempfile.mkdtemp(prefix='index_export_')
+    config.CHROMA_DB_PATH = os.path.join(workdir, 'chroma_db')
+    config.EVENT_INDEX_PATH = os.path.join(workdir, 'event_index.db')
+    config.INDEX_ARCHIVE_PATH = None
+    try:
+        chatbot = RAGChatbot()
+        with open(args.pdf, 'rb') as f:
+            result = chatbot.process_document(f)
+        if not result['success']:
+            print(result['message'], file=sys.stderr)
+            return 1
+
+        print(export_index(chatbot, args.archive)['message'])
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
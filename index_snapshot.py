@@ -0,0 +1,105 @@
+"""Versioned, immutable index snapshots shared between queries and ingests."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Set
+
+
+class IndexSnapshot:
+    """Everything a query needs from one built index version.
+
+    A snapshot is never modified after it is published; an ingest builds a
+    new snapshot and publishes it in its place.
+    """
+
+    def __init__(self, version: int, collection, event_index=None, chunk_store=None,
+                 chunk_count: int = 0):
+        self.version = version
+        self.collection = collection
+        self.event_index = event_index
+        self.chunk_store = chunk_store
+        self.chunk_count = chunk_count
+        self.created_at = time.time()
+
+
+class SnapshotRegistry:
+    """Publishes snapshots and retires old ones once no query is using them.
+
+    Readers pin the current snapshot with ``acquire`` and keep using it even
+    if a newer one is published meanwhile. A replaced snapshot is passed to
+    ``on_retire`` as soon as its last reader releases it. The internal lock
+    only guards reference counts, so readers never wait for an ingest.
+    ``on_retire`` runs in the releasing thread, which may be a query, so it
+    should only hand the snapshot off rather than delete anything itself.
+    """
+
+    def __init__(self, on_retire: Optional[Callable[[IndexSnapshot], None]] = None):
+        self.on_retire = on_retire
+
+        self._lock = threading.Lock()
+        self._current = None
+        self._readers = {}
+
+    def current(self) -> Optional[IndexSnapshot]:
+        """The latest published snapshot, without pinning it."""
+        return self._current
+
+    @contextmanager
+    def acquire(self):
+        """Pin the current snapshot (or None) for the duration of the block."""
+        with self._lock:
+            snapshot = self._current
+            if snapshot is not None:
+                self._readers[snapshot.version] = self._readers.get(snapshot.version, 0) + 1
+
+        try:
+            yield snapshot
+        finally:
+            if snapshot is not None:
+                self._release(snapshot)
+
+    def publish(self, snapshot: IndexSnapshot) -> None:
+        """Make ``snapshot`` current; the previous one retires when unused."""
+        with self._lock:
+            previous = self._current
+            self._current = snapshot
+            retire = (
+                previous is not None
+                and previous.version != snapshot.version
+                and not self._readers.get(previous.version)
+            )
+
+        if retire:
+            self._retire(previous)
+
+    def live_versions(self) -> Set[int]:
+        """Versions that are current or still pinned by a reader."""
+        with self._lock:
+            live = {version for version, count in self._readers.items() if count}
+            if self._current is not None:
+                live.add(self._current.version)
+            return live
+
+    def get_stats(self) -> Dict[str, any]:
+        with self._lock:
+            return {
+                'current_version': self._current.version if self._current else None,
+                'readers': {v: c for v, c in self._readers.items() if c}
+            }
+
+    def _release(self, snapshot: IndexSnapshot) -> None:
+        with self._lock:
+            remaining = self._readers[snapshot.version] - 1
+            if remaining:
+                self._readers[snapshot.version] = remaining
+            else:
+                del self._readers[snapshot.version]
+            retire = not remaining and snapshot is not self._current
+
+        if retire:
+            self._retire(snapshot)
+
+    def _retire(self, snapshot: IndexSnapshot) -> None:
+        if self.on_retire is not None:
+            self.on_retire(snapshot)
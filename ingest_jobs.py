@@ -0,0 +1,98 @@
+"""Background document ingestion with job status and progress."""
+
+import io
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+
+class IngestJobManager:
+    """Runs ``RAGChatbot.process_document`` on a background worker pool.
+
+    Jobs are identified by a string id; ``get_job`` returns a copy of the
+    job's status, progress and result so callers can poll it safely.
+    """
+
+    def __init__(self, chatbot, max_workers: int = 1, max_finished_jobs: int = 50):
+        self.chatbot = chatbot
+        self.max_finished_jobs = max_finished_jobs
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ingest')
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._ids = itertools.count(1)
+
+    def submit(self, pdf_bytes: bytes, filename: str = 'document.pdf') -> str:
+        """Queue a PDF for ingestion and return the job id."""
+        with self._lock:
+            job_id = str(next(self._ids))
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'filename': filename,
+                'status': QUEUED,
+                'progress': 0.0,
+                'message': 'Waiting for a worker...',
+                'result': None,
+                'submitted_at': time.time(),
+                'finished_at': None
+            }
+            self._prune_finished()
+
+        self._executor.submit(self._run, job_id, pdf_bytes)
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, any]]:
+        """Current status of a job, or None if unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list_jobs(self) -> List[Dict[str, any]]:
+        """All known jobs, most recent first."""
+        with self._lock:
+            return [dict(job) for job in reversed(list(self._jobs.values()))]
+
+    def has_active_jobs(self) -> bool:
+        with self._lock:
+            return any(job['status'] in (QUEUED, RUNNING) for job in self._jobs.values())
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job_id: str, pdf_bytes: bytes) -> None:
+        self._update(job_id, status=RUNNING, message='Starting...')
+
+        def on_progress(fraction: float, message: str) -> None:
+            self._update(job_id, progress=fraction, message=message)
+
+        try:
+            result = self.chatbot.process_document(io.BytesIO(pdf_bytes), progress_callback=on_progress)
+        except Exception as e:
+            result = {'success': False, 'message': f'Error processing document: {str(e)}'}
+
+        self._update(
+            job_id,
+            status=COMPLETED if result['success'] else FAILED,
+            progress=1.0 if result['success'] else self.get_job(job_id)['progress'],
+            message=result['message'],
+            result=result,
+            finished_at=time.time()
+        )
+
+    def _update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            self._jobs[job_id].update(fields)
+
+    def _prune_finished(self) -> None:
+        """Forget the oldest finished jobs beyond ``max_finished_jobs``."""
+        finished = [job_id for job_id, job in self._jobs.items()
+                    if job['status'] in (COMPLETED, FAILED)]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
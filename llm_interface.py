@@ -2,14 +2,19 @@
 
 import requests
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+class ModelNotFoundError(Exception):
+    """Raised when the requested model is not pulled on the Ollama server."""
 
 class OllamaLLM:
     """Interface for Ollama local LLM."""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "mistral"):
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "mistral",
+                 timeout: float = 300):
         self.base_url = base_url
         self.model = model
+        self.timeout = timeout
         self.generate_url = f"{base_url}/api/generate"
     
     def is_available(self) -> bool:
@@ -22,6 +27,17 @@ class OllamaLLM:
     
     def generate_response(self, prompt: str, context_chunks: List[Dict[str, any]]) -> str:
         """Generate response using retrieved context."""
+        try:
+            return self.generate(prompt, context_chunks)
+        except Exception as e:
+            return f"Error connecting to LLM: {str(e)}"
+    
+    def generate(self, prompt: str, context_chunks: List[Dict[str, any]],
+                 model: Optional[str] = None) -> str:
+        """Generate response using retrieved context, raising on any failure.
+        
+        ``model`` overrides the default model for this request only.
+        """
         # Prepare context from retrieved chunks
         context = "\n\n".join([chunk['text'] for chunk in context_chunks])
         
@@ -40,7 +56,7 @@ class OllamaLLM:
         #     }
         # }
         data = {
-        "model": self.model,
+        "model": model or self.model,
         "prompt": full_prompt,
         "stream": True,  # Enable streaming
         "options": {
@@ -50,29 +66,30 @@ class OllamaLLM:
         }
     }
         
-        try:
-            response = requests.post(
-                self.generate_url,
-                headers={"Content-Type": "application/json"},
-                data=json.dumps(data),
-                timeout=300,  # Longer timeout for streaming
-                stream=True
-            )
-            
-            if response.status_code == 200:
-                full_response = ""
-                for line in response.iter_lines():
-                    if line:
-                        chunk = json.loads(line.decode('utf-8'))
-                        if 'response' in chunk:
-                            full_response += chunk['response']
-                        if chunk.get('done', False):
-                            break
-                return full_response
-        # ... error handling ...
+        response = requests.post(
+            self.generate_url,
+            headers={"Content-Type": "application/json"},
+            data=json.dumps(data),
+            timeout=self.timeout,  # Longer timeout for streaming
+            stream=True
+        )
         
-        except Exception as e:
-            return f"Error connecting to LLM: {str(e)}"
+        if response.status_code == 404:
+            raise ModelNotFoundError(f"Model {data['model']} is not available at {self.base_url}")
+        if response.status_code != 200:
+            raise Exception(f"Ollama returned status {response.status_code}")
+        
+        full_response = ""
+        for line in response.iter_lines():
+            if line:
+                chunk = json.loads(line.decode('utf-8'))
+                if 'error' in chunk:
+                    raise Exception(chunk['error'])
+                if 'response' in chunk:
+                    full_response += chunk['response']
+                if chunk.get('done', False):
+                    break
+        return full_response
     
     def _create_prompt(self, question: str, context: str) -> str:
         """Create a well-structured prompt for the LLM."""
@@ -0,0 +1,176 @@
+"""Routing of generation requests across several Ollama endpoints."""
+
+import threading
+import time
+from typing import List, Dict, Optional
+
+from llm_interface import OllamaLLM, ModelNotFoundError
+
+FACTUAL_QUESTION_WORDS = {'what', 'when', 'where', 'who', 'which', 'is', 'are', 'does', 'do'}
+OPEN_ENDED_WORDS = {'why', 'explain', 'describe', 'compare', 'summarize', 'summarise', 'discuss'}
+
+
+class EndpointState:
+    """Load, health and latency tracking for a single endpoint."""
+
+    def __init__(self, llm: OllamaLLM):
+        self.llm = llm
+        self.outstanding = 0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.latency_ewma = None
+        self.requests = 0
+        self.failures = 0
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.unhealthy_until
+
+
+class LLMRouter:
+    """Spreads requests over Ollama endpoints with failover.
+
+    Each request goes to the healthy endpoint with the fewest outstanding
+    requests, ties broken by observed latency. An endpoint that fails
+    ``failure_threshold`` times in a row is skipped for ``cooldown`` seconds.
+    Failed requests are retried on the remaining endpoints. Short factual
+    questions can be sent to a smaller ``fast_model``; if an endpoint has not
+    pulled it, the request is retried there with the default model.
+    """
+
+    def __init__(self, base_urls: List[str], model: str = "mistral",
+                 fast_model: Optional[str] = None, timeout: float = 300,
+                 failure_threshold: int = 2, cooldown: float = 30.0,
+                 fast_question_max_words: int = 12, latency_smoothing: float = 0.3):
+        if not base_urls:
+            raise ValueError("At least one endpoint URL is required")
+
+        self.model = model
+        self.fast_model = fast_model
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.fast_question_max_words = fast_question_max_words
+        self.latency_smoothing = latency_smoothing
+
+        self.endpoints = [
+            EndpointState(OllamaLLM(base_url=url, model=model, timeout=timeout))
+            for url in base_urls
+        ]
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """Check whether at least one endpoint is reachable."""
+        now = time.monotonic()
+        ordered = sorted(self.endpoints, key=lambda ep: not ep.is_healthy(now))
+        for endpoint in ordered:
+            if endpoint.llm.is_available():
+                return True
+            self._record_failure(endpoint)
+        return False
+
+    def generate_response(self, prompt: str, context_chunks: List[Dict[str, any]]) -> str:
+        """Generate response using retrieved context."""
+        try:
+            return self.generate(prompt, context_chunks)
+        except Exception as e:
+            return f"Error connecting to LLM: {str(e)}"
+
+    def generate(self, prompt: str, context_chunks: List[Dict[str, any]]) -> str:
+        """Generate on the least loaded endpoint, failing over on errors."""
+        model = self.select_model(prompt)
+        tried = set()
+        last_error = None
+
+        while True:
+            endpoint = self._acquire_endpoint(tried)
+            if endpoint is None:
+                raise Exception(f"All LLM endpoints failed: {last_error}")
+            tried.add(id(endpoint))
+
+            start = time.monotonic()
+            try:
+                try:
+                    result = endpoint.llm.generate(prompt, context_chunks, model=model)
+                except ModelNotFoundError:
+                    if model == self.model:
+                        raise
+                    # The fast model is best-effort; use the default model from here on
+                    model = self.model
+                    result = endpoint.llm.generate(prompt, context_chunks, model=model)
+            except Exception as e:
+                last_error = e
+                self._release_endpoint(endpoint)
+                self._record_failure(endpoint)
+                continue
+
+            self._release_endpoint(endpoint)
+            self._record_success(endpoint, time.monotonic() - start)
+            return result
+
+    def select_model(self, question: str) -> str:
+        """Pick the fast model for short factual questions, else the default."""
+        if not self.fast_model:
+            return self.model
+
+        words = question.lower().split()
+        if not words or len(words) > self.fast_question_max_words:
+            return self.model
+        if words[0] not in FACTUAL_QUESTION_WORDS:
+            return self.model
+        if OPEN_ENDED_WORDS.intersection(w.strip('?,.') for w in words):
+            return self.model
+        return self.fast_model
+
+    def get_stats(self) -> List[Dict[str, any]]:
+        """Per-endpoint load, health and latency."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    'base_url': ep.llm.base_url,
+                    'healthy': ep.is_healthy(now),
+                    'outstanding': ep.outstanding,
+                    'requests': ep.requests,
+                    'failures': ep.failures,
+                    'latency_ewma': ep.latency_ewma
+                }
+                for ep in self.endpoints
+            ]
+
+    def _acquire_endpoint(self, tried: set) -> Optional[EndpointState]:
+        """Reserve the best untried endpoint, preferring healthy ones."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [ep for ep in self.endpoints if id(ep) not in tried]
+            if not candidates:
+                return None
+
+            healthy = [ep for ep in candidates if ep.is_healthy(now)]
+            # Endpoints in cooldown are still tried as a last resort
+            pool = healthy or candidates
+            endpoint = min(
+                pool,
+                key=lambda ep: (ep.outstanding, ep.latency_ewma or 0.0)
+            )
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def _release_endpoint(self, endpoint: EndpointState) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+
+    def _record_success(self, endpoint: EndpointState, latency: float) -> None:
+        with self._lock:
+            endpoint.consecutive_failures = 0
+            endpoint.unhealthy_until = 0.0
+            if endpoint.latency_ewma is None:
+                endpoint.latency_ewma = latency
+            else:
+                endpoint.latency_ewma += self.latency_smoothing * (latency - endpoint.latency_ewma)
+
+    def _record_failure(self, endpoint: EndpointState) -> None:
+        with self._lock:
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.failure_threshold:
+                endpoint.unhealthy_until = time.monotonic() + self.cooldown
@@ -2,8 +2,17 @@
 
 from document_processor import DocumentProcessor
 from vector_store import VectorStore
-from llm_interface import OllamaLLM
-from typing import List, Dict, Optional
+from llm_router import LLMRouter
+from generation_scheduler import GenerationScheduler, GenerationRejected
+from extractive_answerer import ExtractiveAnswerer
+from event_index import EventIndex, versioned_path, locate_session, locate_speaker_profile
+from index_snapshot import IndexSnapshot, SnapshotRegistry
+from chunk_store import ChunkStore
+import index_archive
+from typing import List, Dict, Optional, Callable
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import config
 
 class RAGChatbot:
@@ -18,36 +27,110 @@ class RAGChatbot:
         self.vector_store = VectorStore(
             db_path=config.CHROMA_DB_PATH,
             collection_name=config.COLLECTION_NAME,
-            embedding_model=config.EMBEDDING_MODEL
+            embedding_model=config.EMBEDDING_MODEL,
+            reduced_dimension=config.VECTOR_REDUCED_DIMENSION,
+            reduction_method=config.VECTOR_REDUCTION_METHOD,
+            quantization=config.VECTOR_QUANTIZATION,
+            rescore_factor=config.RESCORE_CANDIDATES_FACTOR
         )
         
-        self.llm = OllamaLLM(
-            base_url=config.OLLAMA_BASE_URL,
-            model=config.DEFAULT_MODEL
+        self.llm = LLMRouter(
+            base_urls=config.OLLAMA_ENDPOINTS,
+            model=config.DEFAULT_MODEL,
+            fast_model=config.FAST_MODEL,
+            timeout=config.LLM_REQUEST_TIMEOUT,
+            failure_threshold=config.ENDPOINT_FAILURE_THRESHOLD,
+            cooldown=config.ENDPOINT_COOLDOWN,
+            fast_question_max_words=config.FAST_QUESTION_MAX_WORDS
         )
         
-        self.is_initialized = False
+        self.scheduler = GenerationScheduler(
+            self.llm.generate,
+            max_concurrent=config.MAX_CONCURRENT_GENERATIONS,
+            max_queue_wait=config.GENERATION_QUEUE_WAIT,
+            max_queue_size=config.GENERATION_QUEUE_SIZE
+        )
+        
+        self.extractive_answerer = ExtractiveAnswerer(
+            confidence_threshold=config.EXTRACTIVE_CONFIDENCE_THRESHOLD
+        ) if config.EXTRACTIVE_ANSWERS_ENABLED else None
+        
+        # Queries read from the current snapshot; ingests publish new ones.
+        # Retired snapshots are deleted on a background thread, never in a query
+        self._cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='index-cleanup')
+        self.snapshots = SnapshotRegistry(
+            on_retire=lambda snapshot: self._cleanup_executor.submit(self._retire_snapshot, snapshot)
+        )
+        
+        # Chunk stores by index version, kept while their snapshot is live
+        self._chunk_stores = {}
+        
+        # Serialises ingests; queries never take this lock
+        self._ingest_lock = threading.Lock()
+        
+        # Warm start from a prebuilt index archive, if configured
+        self.archive_load_result = None
+        if config.INDEX_ARCHIVE_PATH and os.path.exists(config.INDEX_ARCHIVE_PATH):
+            self.archive_load_result = self.load_index(config.INDEX_ARCHIVE_PATH)
+    
+    @property
+    def is_initialized(self) -> bool:
+        """Whether a processed document is available for questions."""
+        return self.snapshots.current() is not None
     
-    def process_document(self, pdf_file) -> Dict[str, any]:
-        """Process uploaded PDF and store in vector database."""
+    def process_document(self, pdf_file,
+                         progress_callback: Optional[Callable[[float, str], None]] = None) -> Dict[str, any]:
+        """Process uploaded PDF and store in vector database.
+        
+        The new index is built alongside the live one and swapped in only when
+        complete, so questions keep being answered from the previous document
+        meanwhile. ``progress_callback(fraction, message)`` reports progress.
+        """
+        def report(fraction: float, message: str) -> None:
+            if progress_callback is not None:
+                progress_callback(fraction, message)
+        
         try:
-            # Extract text from PDF
-            text = self.document_processor.extract_text_from_pdf(pdf_file)
-            
-            # Chunk the text
-            chunks = self.document_processor.chunk_text(text)
-            
-            # Clear existing data and add new chunks
-            self.vector_store.clear_collection()
-            self.vector_store.add_documents(chunks)
-            
-            self.is_initialized = True
+            with self._ingest_lock:
+                # Extract text from PDF
+                report(0.0, 'Extracting text...')
+                pages = self.document_processor.extract_pages_from_pdf(pdf_file)
+                text = self.document_processor.pages_to_text(pages)
+                
+                # Chunk the text
+                report(0.1, 'Chunking text...')
+                chunks = self.document_processor.chunk_text(text)
+                
+                # Embed into a new collection version
+                version, collection = self.vector_store.build_collection(
+                    chunks,
+                    progress_callback=lambda done, total: report(
+                        0.1 + 0.8 * done / total, f'Embedded {done}/{total} chunks...'
+                    )
+                )
+                
+                # Extract sessions and speakers for direct lookups
+                report(0.9, 'Building event index...')
+                event_index = None
+                index_counts = {'sessions': 0, 'speakers': 0}
+                if config.EVENT_INDEX_ENABLED:
+                    event_index = EventIndex.build(
+                        versioned_path(config.EVENT_INDEX_PATH, version),
+                        pages,
+                        confidence_threshold=config.EXTRACTIVE_CONFIDENCE_THRESHOLD
+                    )
+                    index_counts = event_index.counts()
+                
+                self._publish(version, collection, text, chunks, event_index)
+                report(1.0, 'Done')
             
             return {
                 'success': True,
                 'message': f'Successfully processed document with {len(chunks)} chunks.',
                 'chunks_count': len(chunks),
-                'total_words': len(text.split())
+                'total_words': len(text.split()),
+                'sessions_count': index_counts['sessions'],
+                'speakers_count': index_counts['speakers']
             }
         
         except Exception as e:
@@ -55,51 +138,185 @@ class RAGChatbot:
                 'success': False,
                 'message': f'Error processing document: {str(e)}',
                 'chunks_count': 0,
-                'total_words': 0
+                'total_words': 0,
+                'sessions_count': 0,
+                'speakers_count': 0
             }
     
-    def answer_question(self, question: str, top_k: int = 5) -> Dict[str, any]:
-        """Answer question using RAG approach."""
-        if not self.is_initialized:
+    def load_prebuilt_index(self, text: str, chunks: List[Dict[str, any]], embeddings,
+                            event_index_db: Optional[bytes] = None) -> Dict[str, any]:
+        """Serve an index built elsewhere, reusing its embeddings instead of re-embedding.
+        
+        ``event_index_db`` is the raw content of a structured event index
+        database, if one was built.
+        """
+        with self._ingest_lock:
+            version, collection = self.vector_store.build_collection(chunks, embeddings=embeddings)
+            
+            event_index = None
+            if config.EVENT_INDEX_ENABLED and event_index_db is not None:
+                db_path = versioned_path(config.EVENT_INDEX_PATH, version)
+                with open(db_path, 'wb') as f:
+                    f.write(event_index_db)
+                event_index = EventIndex(
+                    db_path, confidence_threshold=config.EXTRACTIVE_CONFIDENCE_THRESHOLD
+                )
+            
+            self._publish(version, collection, text, chunks, event_index)
+        
+        counts = event_index.counts() if event_index else {'sessions': 0, 'speakers': 0}
+        return {
+            'success': True,
+            'message': f'Loaded prebuilt index with {len(chunks)} chunks.',
+            'chunks_count': len(chunks),
+            'total_words': len(text.split()),
+            'sessions_count': counts['sessions'],
+            'speakers_count': counts['speakers']
+        }
+    
+    def export_index(self, archive_path: str) -> Dict[str, any]:
+        """Write the current index to a versioned archive; see ``index_archive``."""
+        try:
+            return index_archive.export_index(self, archive_path)
+        except Exception as e:
             return {
                 'success': False,
-                'answer': 'Please upload and process a document first.',
-                'sources': []
+                'message': f'Error exporting index archive: {str(e)}'
             }
-        
-        if not self.llm.is_available():
+    
+    def load_index(self, archive_path: str) -> Dict[str, any]:
+        """Validate an index archive and start serving it without re-embedding."""
+        try:
+            return index_archive.load_index(self, archive_path)
+        except Exception as e:
             return {
                 'success': False,
-                'answer': 'LLM service (Ollama) is not available. Please ensure Ollama is running.',
-                'sources': []
+                'message': f'Error loading index archive: {str(e)}',
+                'chunks_count': 0,
+                'total_words': 0,
+                'sessions_count': 0,
+                'speakers_count': 0
             }
+    
+    def _publish(self, version: int, collection, text: str, chunks: List[Dict[str, any]],
+                 event_index: Optional[EventIndex]) -> None:
+        """Start serving a built version; in-flight queries finish on the old one."""
+        chunk_store = ChunkStore(text, chunks)
+        self._chunk_stores[version] = chunk_store
+        self.vector_store.activate_collection(version, collection)
+        self.snapshots.publish(IndexSnapshot(
+            version, collection, event_index=event_index,
+            chunk_store=chunk_store, chunk_count=len(chunks)
+        ))
+        self._drop_unused_versions()
+    
+    def answer_question(self, question: str, top_k: int = 5, priority: int = 0,
+                        deadline: Optional[float] = None) -> Dict[str, any]:
+        """Answer question using RAG approach.
         
-        try:
-            # Retrieve relevant chunks
-            relevant_chunks = self.vector_store.search_similar(question, top_k=top_k)
-            
-            if not relevant_chunks:
+        ``priority`` and ``deadline`` are passed to the generation scheduler;
+        lower priority values are served first.
+        """
+        # Pin one index version for the lookups below, even if an ingest
+        # publishes a new one meanwhile
+        with self.snapshots.acquire() as snapshot:
+            if snapshot is None:
                 return {
                     'success': False,
-                    'answer': 'No relevant information found in the document.',
+                    'answer': 'Please upload and process a document first.',
                     'sources': []
                 }
             
-            # Generate response using LLM
-            answer = self.llm.generate_response(question, relevant_chunks)
+            try:
+                # Schedule and speaker lookups straight from the structured index
+                if snapshot.event_index is not None:
+                    indexed = snapshot.event_index.lookup(question)
+                    if indexed is not None:
+                        return {
+                            'success': True,
+                            'degraded': False,
+                            'answer_method': 'event_index',
+                            'answer': indexed['answer'],
+                            'sources': self._index_sources(snapshot, indexed)
+                        }
+                
+                # Retrieve relevant chunks
+                relevant_chunks = self.vector_store.search_similar(
+                    question, top_k=top_k, collection=snapshot.collection
+                )
             
-            # Prepare source information
+            except Exception as e:
+                return {
+                    'success': False,
+                    'answer': f'Error generating answer: {str(e)}',
+                    'sources': []
+                }
+        
+        if not relevant_chunks:
+            return {
+                'success': False,
+                'answer': 'No relevant information found in the document.',
+                'sources': []
+            }
+        
+        try:
+            # Prepare compact source references; previews are sliced on demand
             sources = [
                 {
+                    'version': snapshot.version,
                     'chunk_id': chunk['metadata']['chunk_id'],
-                    'text_preview': chunk['text'][:200] + '...' if len(chunk['text']) > 200 else chunk['text'],
+                    'page': chunk['metadata'].get('page') or None,
+                    'start_char': chunk['metadata'].get('start_char'),
+                    'end_char': chunk['metadata'].get('end_char'),
                     'relevance_score': 1 - chunk['distance'] if chunk['distance'] else None
                 }
                 for chunk in relevant_chunks
             ]
             
+            # Answer simple lookups straight from the retrieved chunks
+            if self.extractive_answerer is not None:
+                extracted = self.extractive_answerer.answer(question, relevant_chunks)
+                if extracted is not None:
+                    return {
+                        'success': True,
+                        'degraded': False,
+                        'answer_method': 'extractive',
+                        'answer': extracted['answer'],
+                        'sources': sources
+                    }
+            
+            if not self.llm.is_available():
+                return {
+                    'success': False,
+                    'answer': 'LLM service (Ollama) is not available. Please ensure Ollama is running.',
+                    'sources': []
+                }
+            
+            # Generate response using LLM, degrading to sources only under load
+            try:
+                answer = self.scheduler.submit(
+                    question, relevant_chunks, priority=priority, deadline=deadline
+                )
+            except GenerationRejected as e:
+                return {
+                    'success': True,
+                    'degraded': True,
+                    'answer_method': 'sources_only',
+                    'answer': f'The assistant is busy right now ({e.reason}) '
+                              'Here are the most relevant passages from the document.',
+                    'sources': sources
+                }
+            except Exception as e:
+                return {
+                    'success': False,
+                    'answer': f'Error connecting to LLM: {str(e)}',
+                    'sources': []
+                }
+            
             return {
                 'success': True,
+                'degraded': False,
+                'answer_method': 'llm',
                 'answer': answer,
                 'sources': sources
             }
@@ -110,3 +327,70 @@ class RAGChatbot:
                 'answer': f'Error generating answer: {str(e)}',
                 'sources': []
             }
+    
+    def _index_sources(self, snapshot: IndexSnapshot, indexed: Dict[str, any]) -> List[Dict[str, any]]:
+        """Source reference to the chunk holding the session or profile an index answer came from."""
+        chunk_store = snapshot.chunk_store
+        offset = None
+        if indexed.get('session') is not None:
+            offset = locate_session(chunk_store.text, indexed['session'])
+        elif indexed.get('speaker') is not None:
+            speaker = indexed['speaker']
+            offset = locate_speaker_profile(chunk_store.text, speaker)
+            # Speakers without a profile block are cited by their first session
+            if offset is None and speaker['sessions']:
+                offset = locate_session(chunk_store.text, speaker['sessions'][0])
+        
+        chunk_id = chunk_store.chunk_at(offset) if offset is not None else None
+        if chunk_id is None:
+            return []
+        
+        start_char, end_char = chunk_store.get_span(chunk_id)
+        return [{
+            'version': snapshot.version,
+            'chunk_id': chunk_id,
+            'page': chunk_store.get_page(chunk_id),
+            'start_char': start_char,
+            'end_char': end_char,
+            'relevance_score': None
+        }]
+    
+    def get_source_preview(self, source: Dict[str, any], length: int = 200) -> Optional[str]:
+        """Preview text for a source reference, or None if its document was replaced."""
+        chunk_store = self._chunk_stores.get(source['version'])
+        if chunk_store is None or source['chunk_id'] >= len(chunk_store):
+            return None
+        return chunk_store.preview(source['chunk_id'], length=length)
+    
+    def get_generation_stats(self) -> Dict[str, any]:
+        """Return generation queue depth and wait statistics."""
+        return self.scheduler.get_stats()
+    
+    def get_extractive_stats(self) -> Optional[Dict[str, any]]:
+        """Return extractive fast-path hit rate and latency, if enabled."""
+        if self.extractive_answerer is None:
+            return None
+        return self.extractive_answerer.get_stats()
+    
+    def wait_for_cleanup(self) -> None:
+        """Block until retired index versions queued so far have been deleted."""
+        self._cleanup_executor.submit(lambda: None).result()
+    
+    def _retire_snapshot(self, snapshot: IndexSnapshot) -> None:
+        """Delete the storage of a snapshot no query is using any more."""
+        # Runs on the cleanup thread; the ingest lock keeps it from racing
+        # with _drop_unused_versions
+        with self._ingest_lock:
+            self._chunk_stores.pop(snapshot.version, None)
+            self.vector_store.drop_version(snapshot.version)
+            if snapshot.event_index is not None:
+                snapshot.event_index.remove()
+    
+    def _drop_unused_versions(self) -> None:
+        """Delete index versions left over from earlier runs or failed ingests."""
+        live = self.snapshots.live_versions()
+        for version in self.vector_store.list_versions():
+            if version not in live:
+                self.vector_store.drop_version(version)
+                if os.path.exists(versioned_path(config.EVENT_INDEX_PATH, version)):
+                    os.remove(versioned_path(config.EVENT_INDEX_PATH, version))
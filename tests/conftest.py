@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# The modules live at the repository root rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def sample_pdf(tmp_path_factory):
+    """The comprehensive sample event PDF, generated into a temporary directory."""
+    pytest.importorskip('fpdf')
+    from generate_sample_pdf import create_comprehensive_event_pdf
+
+    directory = tmp_path_factory.mktemp('sample_pdf')
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        return str(directory / create_comprehensive_event_pdf())
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope='session')
+def sample_pages(sample_pdf):
+    """Raw page texts of the sample PDF."""
+    from document_processor import DocumentProcessor
+
+    with open(sample_pdf, 'rb') as f:
+        return DocumentProcessor().extract_pages_from_pdf(f)
@@ -0,0 +1,90 @@
+"""EventIndex lookups on a small synthetic agenda."""
+
+import pytest
+
+from event_index import EventIndex
+
+PAGES = [
+    """Day 1 - June 15, 2024
+9:00 AM - 10:00 AM: Opening Keynote - The Future of AI
+Speaker: Dr. Sarah Chen (Google DeepMind)
+Location: Main Auditorium
+10:45 AM - 12:00 PM: Workshop - Building RAG Applications
+Instructor: Dr. Alex Kumar (Anthropic)
+Location: Workshop Room A
+Capacity: 50 participants""",
+    """SPEAKER PROFILES
+Dr. Sarah Chen
+Title: AI Research Director
+Organization: Google DeepMind
+Dr. Chen leads advanced AI research.
+Lisa Wang
+Title: Chief Technology Officer
+Organization: OpenAI
+Lisa Wang oversees technical strategy."""
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    return EventIndex.build(str(tmp_path / 'event_index.db'), PAGES)
+
+
+def test_profile_question(index):
+    result = index.lookup("Who is Dr. Sarah Chen?")
+    assert result['answer'].startswith("Dr. Sarah Chen - AI Research Director, Google DeepMind")
+
+
+def test_speaker_schedule_question(index):
+    result = index.lookup("Which sessions is Kumar part of?")
+    assert "Building RAG Applications" in result['answer']
+
+
+@pytest.mark.parametrize('question', [
+    "How many people attend the Kumar workshop?",
+    "What does Lisa Wang think about responsible AI?",
+])
+def test_other_questions_naming_a_speaker_fall_through(index, question):
+    assert index.lookup(question) is None
+
+
+@pytest.fixture(scope='module')
+def sample_index(sample_pages, tmp_path_factory):
+    return EventIndex.build(str(tmp_path_factory.mktemp('index') / 'event_index.db'), sample_pages)
+
+
+def test_sample_pdf_ground_truth(sample_index):
+    assert sample_index.counts() == {'sessions': 20, 'speakers': 10}
+    assert len(sample_index.get_sessions(day='1')) == 11
+    assert len(sample_index.get_sessions(day='2')) == 9
+
+    workshops = {s['title']: s for s in sample_index.get_sessions() if s['title'].startswith('Workshop')}
+    rag = workshops['Workshop - "Building Production-Ready RAG Applications"']
+    assert rag['location'] == 'Workshop Room A'
+    assert rag['instructor'] == 'Dr. Alex Kumar (Microsoft Research)'
+    assert rag['day'].startswith('Day 1 ')
+    tuning = workshops['Workshop - "LLM Fine-tuning and Optimization"']
+    assert tuning['location'] == 'Workshop Room A'
+    assert tuning['instructor'] == 'Dr. Jennifer Lee (Hugging Face)'
+    assert tuning['day'].startswith('Day 2 ')
+
+
+@pytest.mark.parametrize('question, expected', [
+    ("Which room is the fine-tuning workshop?", "is in Workshop Room A"),
+    ("Who is teaching the RAG workshop?", "Instructor: Dr. Alex Kumar"),
+    ("Who is Dr. Jennifer Lee?", "Dr. Jennifer Lee - "),
+])
+def test_sample_pdf_lookups(sample_index, question, expected):
+    assert expected in sample_index.lookup(question)['answer']
+
+
+@pytest.mark.parametrize('question', [
+    "Where is the conference?",
+    "Where is the conference held?",
+    "When does the conference start?",
+    "When does the conference end?",
+    "How many people attend the Kumar workshop?",
+    "What does Lisa Wang think about responsible AI?",
+])
+def test_sample_pdf_questions_left_to_retrieval(sample_index, question):
+    assert sample_index.lookup(question) is None
@@ -0,0 +1,63 @@
+"""Extractive answers from the chunks of the sample event PDF."""
+
+import pytest
+
+import config
+from document_processor import DocumentProcessor
+from extractive_answerer import ExtractiveAnswerer, parse_sessions
+
+
+@pytest.fixture(scope='module')
+def chunks(sample_pages):
+    processor = DocumentProcessor(chunk_size=config.CHUNK_SIZE, chunk_overlap=config.CHUNK_OVERLAP)
+    return processor.chunk_text(processor.pages_to_text(sample_pages))
+
+
+@pytest.fixture
+def answerer():
+    return ExtractiveAnswerer(confidence_threshold=config.EXTRACTIVE_CONFIDENCE_THRESHOLD)
+
+
+@pytest.mark.parametrize('question, expected', [
+    ("Which room is the fine-tuning workshop?", "is in Workshop Room A"),
+    ("Who moderates the ethics panel?", "Moderator: Prof. Maria Santos"),
+    ("What time does the RAG workshop start?", "runs from 10:45 AM - 12:00 PM"),
+    ("Who is teaching the RAG workshop?", "Instructor: Dr. Alex Kumar"),
+    ("When is the welcome reception?", "runs from 5:00 PM - 7:00 PM in Rooftop Terrace."),
+])
+def test_answers_clear_matches(answerer, chunks, question, expected):
+    result = answerer.answer(question, chunks)
+    assert result is not None
+    assert expected in result['answer']
+
+
+@pytest.mark.parametrize('question', [
+    # "Conference" only appears in a speaker field ("Conference Chair ...")
+    "Where is the conference held?",
+    "When does the conference start?",
+    "When does the conference end?",
+    # Several sessions match equally well
+    "Where is the keynote?",
+    "Where is lunch?",
+    # No intent the answerer handles
+    "How many people attend the RAG workshop?",
+])
+def test_falls_through_on_weak_or_ambiguous_matches(answerer, chunks, question):
+    assert answerer.answer(question, chunks) is None
+
+
+def test_stats_count_hits(answerer, chunks):
+    answerer.answer("Who moderates the ethics panel?", chunks)
+    answerer.answer("Where is the conference held?", chunks)
+    stats = answerer.get_stats()
+    assert stats['attempts'] == 2 and stats['hits'] == 1
+
+
+def test_parse_sessions_fields():
+    text = ("10:45 AM - 12:00 PM: Workshop - Building RAG Applications "
+            "Instructor: Dr. Alex Kumar (Microsoft Research) Location: Workshop Room A Page 2")
+    [session] = parse_sessions(text)
+    assert session['start'] == '10:45 AM' and session['end'] == '12:00 PM'
+    assert session['title'] == 'Workshop - Building RAG Applications'
+    assert session['instructor'] == 'Dr. Alex Kumar (Microsoft Research)'
+    assert session['location'] == 'Workshop Room A'
@@ -0,0 +1,127 @@
+"""GenerationScheduler admission control and queueing."""
+
+import threading
+import time
+
+import pytest
+
+from generation_scheduler import GenerationScheduler, GenerationRejected
+
+
+class BlockingGenerator:
+    """generate_fn that holds its slot until released and records call order."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = []
+
+    def __call__(self, prompt, chunks):
+        self.calls.append(prompt)
+        self.started.set()
+        if prompt == 'blocker':
+            self.release.wait(timeout=10)
+        return f"answer to {prompt}"
+
+
+def start_blocker(scheduler, generator):
+    thread = threading.Thread(target=scheduler.submit, args=('blocker', []))
+    thread.start()
+    assert generator.started.wait(timeout=5)
+    return thread
+
+
+def wait_for_queue_depth(scheduler, depth):
+    for _ in range(500):
+        if scheduler.queue_depth() == depth:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"queue depth never reached {depth}")
+
+
+def test_waiting_requests_are_served_by_priority():
+    generator = BlockingGenerator()
+    scheduler = GenerationScheduler(generator, max_concurrent=1)
+    blocker = start_blocker(scheduler, generator)
+
+    threads = []
+    for prompt, priority in (('low', 5), ('high', 0), ('mid', 1)):
+        thread = threading.Thread(target=scheduler.submit, args=(prompt, []), kwargs={'priority': priority})
+        thread.start()
+        threads.append(thread)
+        wait_for_queue_depth(scheduler, len(threads))
+
+    generator.release.set()
+    for thread in [blocker] + threads:
+        thread.join(timeout=5)
+
+    assert generator.calls == ['blocker', 'high', 'mid', 'low']
+    assert scheduler.get_stats()['completed'] == 4
+
+
+def test_full_queue_rejects():
+    generator = BlockingGenerator()
+    scheduler = GenerationScheduler(generator, max_concurrent=1, max_queue_size=1)
+    blocker = start_blocker(scheduler, generator)
+
+    queued = threading.Thread(target=scheduler.submit, args=('queued', []))
+    queued.start()
+    wait_for_queue_depth(scheduler, 1)
+
+    with pytest.raises(GenerationRejected, match='queue is full'):
+        scheduler.submit('overflow', [])
+
+    generator.release.set()
+    blocker.join(timeout=5)
+    queued.join(timeout=5)
+    assert scheduler.get_stats()['rejected'] == 1
+
+
+def test_wait_budget_times_out():
+    generator = BlockingGenerator()
+    scheduler = GenerationScheduler(generator, max_concurrent=1, max_queue_wait=0.1)
+    blocker = start_blocker(scheduler, generator)
+
+    with pytest.raises(GenerationRejected, match='Timed out') as excinfo:
+        scheduler.submit('late', [])
+    assert excinfo.value.waited >= 0.1
+    assert scheduler.queue_depth() == 0
+
+    generator.release.set()
+    blocker.join(timeout=5)
+
+
+def test_zero_wait_budget_takes_free_slot_but_never_queues():
+    generator = BlockingGenerator()
+    scheduler = GenerationScheduler(generator, max_concurrent=1, max_queue_wait=0)
+
+    assert scheduler.submit('free', []) == 'answer to free'
+
+    blocker = start_blocker(scheduler, generator)
+    with pytest.raises(GenerationRejected, match='Timed out'):
+        scheduler.submit('busy', [])
+
+    generator.release.set()
+    blocker.join(timeout=5)
+
+
+def test_past_deadline_is_rejected_even_with_free_slot():
+    generator = BlockingGenerator()
+    scheduler = GenerationScheduler(generator, max_concurrent=1)
+
+    with pytest.raises(GenerationRejected, match='Deadline passed'):
+        scheduler.submit('stale', [], deadline=time.monotonic() - 10)
+    assert generator.calls == []
+
+    assert scheduler.submit('fresh', [], deadline=time.monotonic() + 10) == 'answer to fresh'
+
+
+def test_failed_generation_is_counted():
+    def failing(prompt, chunks):
+        raise RuntimeError("All LLM endpoints failed")
+
+    scheduler = GenerationScheduler(failing)
+    with pytest.raises(RuntimeError):
+        scheduler.submit('question', [])
+    stats = scheduler.get_stats()
+    assert stats['failed'] == 1 and stats['active'] == 0
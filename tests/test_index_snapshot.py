@@ -0,0 +1,181 @@
+"""Snapshot pinning and retirement, including queries racing re-ingests."""
+
+import threading
+import time
+
+import pytest
+
+import config
+import rag_chatbot
+from index_snapshot import IndexSnapshot, SnapshotRegistry
+
+
+def test_replaced_snapshot_retires_after_last_reader():
+    retired = []
+    registry = SnapshotRegistry(on_retire=retired.append)
+    registry.publish(IndexSnapshot(1, collection=None))
+
+    with registry.acquire() as pinned:
+        registry.publish(IndexSnapshot(2, collection=None))
+        assert pinned.version == 1
+        assert registry.live_versions() == {1, 2}
+        assert retired == []
+
+    assert [s.version for s in retired] == [1]
+    assert registry.live_versions() == {2}
+
+
+def test_unpinned_snapshot_retires_on_publish():
+    retired = []
+    registry = SnapshotRegistry(on_retire=retired.append)
+    registry.publish(IndexSnapshot(1, collection=None))
+    registry.publish(IndexSnapshot(2, collection=None))
+
+    assert [s.version for s in retired] == [1]
+    with registry.acquire() as pinned:
+        assert pinned.version == 2
+
+
+class FakeCollection:
+    def __init__(self, version, chunks):
+        self.version = version
+        self.name = f"event_documents_v{version}"
+        self.chunks = chunks
+
+
+class FakeVectorStore:
+    """In-memory stand-in for VectorStore that fails searches on dropped versions."""
+
+    def __init__(self, **kwargs):
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._next_version = 1
+        self.dropped = set()
+        self.drop_threads = []
+
+    def list_versions(self):
+        with self._lock:
+            return sorted(self._versions)
+
+    def build_collection(self, chunks, progress_callback=None, embeddings=None):
+        with self._lock:
+            version = self._next_version
+            self._next_version += 1
+            collection = self._versions[version] = FakeCollection(version, chunks)
+        if progress_callback is not None:
+            progress_callback(len(chunks), len(chunks))
+        return version, collection
+
+    def activate_collection(self, version, collection):
+        pass
+
+    def drop_version(self, version):
+        with self._lock:
+            self._versions.pop(version, None)
+            self.dropped.add(version)
+            self.drop_threads.append(threading.current_thread().name)
+
+    def search_similar(self, query, top_k=5, collection=None):
+        # Widen the window in which an ingest can publish mid-query
+        time.sleep(0.001)
+        if collection.version in self.dropped:
+            raise RuntimeError(f"Searched dropped version {collection.version}")
+        return [
+            {'text': c['text'], 'metadata': c['metadata'], 'distance': 0.2}
+            for c in collection.chunks[:top_k]
+        ]
+
+
+def agenda_pages(n):
+    return [
+        f"Day 1 - June 15, 2024\n"
+        f"9:00 AM - 10:00 AM: Opening Keynote Edition {n}\n"
+        f"Speaker: Dr. Sarah Chen (Google DeepMind)\n"
+        f"Location: Hall {n}\n"
+        f"Closing remarks for document {n}."
+    ]
+
+
+def make_chatbot(tmp_path, monkeypatch):
+    monkeypatch.setattr(rag_chatbot, 'VectorStore', FakeVectorStore)
+    monkeypatch.setattr(config, 'EVENT_INDEX_PATH', str(tmp_path / 'event_index.db'))
+    monkeypatch.setattr(config, 'INDEX_ARCHIVE_PATH', None)
+
+    bot = rag_chatbot.RAGChatbot()
+    # The "PDF" passed to process_document is just the document number
+    monkeypatch.setattr(bot.document_processor, 'extract_pages_from_pdf', agenda_pages)
+    monkeypatch.setattr(bot.llm, 'is_available', lambda: True)
+    return bot
+
+
+@pytest.fixture
+def chatbot(tmp_path, monkeypatch):
+    bot = make_chatbot(tmp_path, monkeypatch)
+    bot.scheduler.generate_fn = lambda prompt, chunks: chunks[0]['text']
+    return bot
+
+
+def test_index_answers_cite_the_session_chunk(chatbot):
+    assert chatbot.process_document(0)['success']
+
+    response = chatbot.answer_question("Where is the Opening Keynote?")
+    assert response['answer_method'] == 'event_index'
+    [source] = response['sources']
+    assert "Opening Keynote Edition 0" in chatbot.get_source_preview(source, length=1000)
+
+
+def test_llm_failure_is_an_error_response(tmp_path, monkeypatch):
+    # Nothing listens on the discard port, so every endpoint fails
+    monkeypatch.setattr(config, 'OLLAMA_ENDPOINTS', ['http://127.0.0.1:9'])
+    bot = make_chatbot(tmp_path, monkeypatch)
+    assert bot.process_document(0)['success']
+
+    response = bot.answer_question("Summarise the closing remarks")
+    assert not response['success']
+    assert 'All LLM endpoints failed' in response['answer']
+    assert bot.get_generation_stats()['failed'] == 1
+
+
+def test_queries_during_reingest_stay_on_their_snapshot(chatbot, tmp_path):
+    assert chatbot.process_document(0)['success']
+
+    stop = threading.Event()
+    errors = []
+    answered = []
+
+    def reader():
+        while not stop.is_set():
+            for question in ("Where is the Opening Keynote?", "Summarise the closing remarks"):
+                response = chatbot.answer_question(question)
+                if not response['success']:
+                    errors.append(response['answer'])
+                    continue
+                if response['answer_method'] == 'llm':
+                    # The generated text comes from the chunks of the pinned version
+                    version = response['sources'][0]['version']
+                    if f"document {version - 1}." not in response['answer']:
+                        errors.append(f"Answer from another version than {version}")
+                answered.append(response['answer_method'])
+
+    readers = [threading.Thread(target=reader, name=f"reader-{i}") for i in range(8)]
+    for thread in readers:
+        thread.start()
+    try:
+        for n in range(1, 40):
+            assert chatbot.process_document(n)['success']
+    finally:
+        stop.set()
+        for thread in readers:
+            thread.join(timeout=30)
+
+    assert errors == []
+    assert {'event_index', 'llm'} <= set(answered)
+
+    # Old versions are deleted off the query path, and nothing but the current one is left
+    chatbot.wait_for_cleanup()
+    current = chatbot.snapshots.current().version
+    store = chatbot.vector_store
+    assert not [name for name in store.drop_threads if name.startswith('reader')]
+    assert store.list_versions() == [current]
+    assert set(chatbot._chunk_stores) == {current}
+    assert sorted(p.name for p in tmp_path.glob('event_index_v*.db')) == [f"event_index_v{current}.db"]
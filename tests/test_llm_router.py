@@ -0,0 +1,162 @@
+"""LLMRouter against local fake Ollama servers."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from llm_router import LLMRouter
+
+CHUNKS = [{'text': 'Keynote at 9:00 AM in the Main Auditorium.'}]
+
+
+class FakeOllama:
+    """Minimal /api/generate and /api/tags server.
+
+    ``status`` is returned for every generate request; ``models`` limits
+    which models answer (others get a 404 as Ollama does for unpulled
+    models); ``gate`` holds requests until it is set.
+    """
+
+    def __init__(self, name, status=200, models=None, gate=None):
+        self.name = name
+        self.status = status
+        self.models = models
+        self.gate = gate
+        self.requests = []
+        self.in_flight = threading.Event()
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(b'{"models": []}')
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                fake.requests.append(body['model'])
+                fake.in_flight.set()
+                if fake.gate is not None:
+                    fake.gate.wait(timeout=10)
+
+                if fake.models is not None and body['model'] not in fake.models:
+                    self._reply(404, {'error': f"model '{body['model']}' not found"})
+                elif fake.status != 200:
+                    self._reply(fake.status, {'error': 'internal error'})
+                else:
+                    self._reply(200, {'response': f"{fake.name}:{body['model']}", 'done': True})
+
+            def _reply(self, status, payload):
+                data = (json.dumps(payload) + '\n').encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(*args, **kwargs):
+        fake = FakeOllama(*args, **kwargs)
+        started.append(fake)
+        return fake
+
+    yield start
+    for fake in started:
+        fake.close()
+
+
+def test_fails_over_to_healthy_endpoint(servers):
+    broken = servers('broken', status=500)
+    healthy = servers('healthy')
+    router = LLMRouter([broken.url, healthy.url], failure_threshold=1, cooldown=60)
+
+    # The first request lands on the broken endpoint and fails over
+    assert router.generate('When is the keynote?', CHUNKS) == 'healthy:mistral'
+    stats = {s['base_url']: s for s in router.get_stats()}
+    assert not stats[broken.url]['healthy']
+    assert stats[healthy.url]['healthy']
+
+    # While in cooldown the broken endpoint is not tried at all
+    router.generate('When is the keynote?', CHUNKS)
+    assert len(broken.requests) == 1
+
+
+def test_unreachable_endpoint_fails_over(servers):
+    healthy = servers('healthy')
+    dead = servers('dead')
+    dead.close()
+    router = LLMRouter([dead.url, healthy.url], timeout=5)
+
+    assert router.generate('Who is speaking?', CHUNKS) == 'healthy:mistral'
+
+
+def test_all_endpoints_failing_raises(servers):
+    urls = [servers(f'broken{i}', status=500).url for i in range(2)]
+    router = LLMRouter(urls)
+
+    with pytest.raises(Exception, match='All LLM endpoints failed'):
+        router.generate('When is the keynote?', CHUNKS)
+
+
+def test_routes_to_least_outstanding_endpoint(servers):
+    gate = threading.Event()
+    first = servers('first', gate=gate)
+    second = servers('second', gate=gate)
+    router = LLMRouter([first.url, second.url])
+
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.append(router.generate('When is the keynote?', CHUNKS))
+    )
+    worker.start()
+    assert first.in_flight.wait(timeout=5)
+
+    # The first endpoint holds one request, so the next goes to the second
+    other = threading.Thread(
+        target=lambda: results.append(router.generate('When is the keynote?', CHUNKS))
+    )
+    other.start()
+    assert second.in_flight.wait(timeout=5)
+    assert [s['outstanding'] for s in router.get_stats()] == [1, 1]
+
+    gate.set()
+    worker.join(timeout=5)
+    other.join(timeout=5)
+    assert sorted(results) == ['first:mistral', 'second:mistral']
+    assert [s['outstanding'] for s in router.get_stats()] == [0, 0]
+
+
+def test_missing_fast_model_retries_default_model(servers):
+    server = servers('only', models={'mistral'})
+    router = LLMRouter([server.url], fast_model='phi3:mini', failure_threshold=1)
+
+    assert router.generate('When is the keynote?', CHUNKS) == 'only:mistral'
+    assert server.requests == ['phi3:mini', 'mistral']
+    stats = router.get_stats()[0]
+    assert stats['healthy'] and stats['failures'] == 0
+
+
+def test_missing_default_model_counts_as_failure(servers):
+    server = servers('only', models={'phi3:mini'})
+    router = LLMRouter([server.url], fast_model='phi3:mini', failure_threshold=1)
+
+    with pytest.raises(Exception, match='All LLM endpoints failed'):
+        router.generate('Please explain the agenda for the whole second day in detail', CHUNKS)
+    assert router.get_stats()[0]['failures'] == 1
@@ -0,0 +1,70 @@
+"""Compressed storage in VectorStore, with a stubbed embedding model."""
+
+import zlib
+
+import numpy as np
+import pytest
+
+import vector_store
+from vector_compression import exact_search
+
+
+class FakeEmbedder:
+    """Deterministic unit vectors keyed by text."""
+
+    def __init__(self, model_name, dimension=64):
+        self.dimension = dimension
+
+    def get_sentence_embedding_dimension(self):
+        return self.dimension
+
+    def encode(self, texts, convert_to_tensor=False):
+        vectors = np.array([
+            np.random.default_rng(zlib.crc32(text.encode('utf-8'))).standard_normal(self.dimension)
+            for text in texts
+        ], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def chunks():
+    return [
+        {'text': f"Session {i} in room {i % 7}", 'metadata': {'chunk_id': i}}
+        for i in range(200)
+    ]
+
+
+def make_store(tmp_path, monkeypatch, **kwargs):
+    monkeypatch.setattr(vector_store, 'SentenceTransformer', FakeEmbedder)
+    return vector_store.VectorStore(str(tmp_path / 'chroma'), 'events', 'fake', **kwargs)
+
+
+def test_int8_store_keeps_no_float_vectors_in_chroma(tmp_path, monkeypatch, chunks):
+    store = make_store(tmp_path, monkeypatch, reduced_dimension=32, quantization='int8')
+    _, collection = store.build_collection(chunks)
+
+    stored = collection.get(ids=['chunk_0'], include=['embeddings'])['embeddings']
+    assert len(stored[0]) == 1
+
+    stats = store.get_compression_stats(collection)
+    assert stats['chroma_bytes_per_vector'] == 4
+    assert stats['codes_bytes_per_vector'] == 32
+    assert stats['stored_bytes_per_vector'] < stats['full_bytes_per_vector'] / 4
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'reduced_dimension': 32},
+    {'quantization': 'int8'},
+    {'reduced_dimension': 32, 'quantization': 'int8'},
+])
+def test_compressed_search_matches_exact_search(tmp_path, monkeypatch, chunks, kwargs):
+    store = make_store(tmp_path, monkeypatch, rescore_factor=8, **kwargs)
+    _, collection = store.build_collection(chunks)
+    embeddings = store.embed_chunks(chunks)
+
+    for i in range(0, 200, 40):
+        query = chunks[i]['text']
+        results = store.search_similar(query, top_k=5, collection=collection)
+        expected = exact_search(embeddings, store.embedding_model.encode([query])[0], 5)
+        assert [r['metadata']['chunk_id'] for r in results][0] == i
+        assert len({r['metadata']['chunk_id'] for r in results} & set(expected.tolist())) >= 4
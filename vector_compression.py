@@ -0,0 +1,178 @@
+"""Dimensionality reduction and int8 quantization of embedding vectors."""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+REDUCTION_METHODS = ('pca', 'truncate')
+QUANTIZATION_MODES = (None, 'int8')
+
+
+class VectorCompressor:
+    """Reduces embeddings to fewer dimensions and optionally quantizes them.
+
+    ``pca`` projects onto the top principal components of the corpus;
+    ``truncate`` keeps the leading dimensions (Matryoshka-style), which only
+    works well for models trained for it. Reduced vectors are L2-normalised.
+    With ``int8`` quantization each dimension is scaled symmetrically into
+    [-127, 127].
+    """
+
+    def __init__(self, dimensions: Optional[int] = None, method: str = 'pca',
+                 quantization: Optional[str] = None):
+        if method not in REDUCTION_METHODS:
+            raise ValueError(f"Unknown reduction method: {method}")
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Unknown quantization mode: {quantization}")
+
+        self.dimensions = dimensions
+        self.method = method
+        self.quantization = quantization
+
+        self.mean = None
+        self.components = None
+        self.scales = None
+
+    def fit(self, embeddings: np.ndarray) -> 'VectorCompressor':
+        """Learn the projection and quantization scales from corpus embeddings."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        dimensions = self.dimensions or embeddings.shape[1]
+
+        if self.method == 'pca' and dimensions < embeddings.shape[1]:
+            self.mean = embeddings.mean(axis=0)
+            centered = embeddings - self.mean
+            # Eigen-decomposition of the d x d covariance is cheap for any corpus size
+            covariance = centered.T @ centered / max(len(embeddings) - 1, 1)
+            eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+            order = np.argsort(eigenvalues)[::-1][:dimensions]
+            self.components = eigenvectors[:, order].astype(np.float32)
+        else:
+            self.mean = None
+            self.components = None
+        self.dimensions = dimensions
+
+        if self.quantization == 'int8':
+            reduced = self.reduce(embeddings)
+            self.scales = np.maximum(np.abs(reduced).max(axis=0), 1e-8) / 127.0
+        return self
+
+    def reduce(self, embeddings: np.ndarray) -> np.ndarray:
+        """Project embeddings to the reduced, normalised float representation."""
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if self.components is not None:
+            reduced = (embeddings - self.mean) @ self.components
+        else:
+            reduced = embeddings[:, :self.dimensions]
+        norms = np.linalg.norm(reduced, axis=1, keepdims=True)
+        return reduced / np.maximum(norms, 1e-12)
+
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        """Stored representation: int8 codes, or reduced float32 vectors."""
+        reduced = self.reduce(embeddings)
+        if self.quantization == 'int8':
+            return np.clip(np.round(reduced / self.scales), -127, 127).astype(np.int8)
+        return reduced.astype(np.float32)
+
+    def bytes_per_vector(self) -> int:
+        return self.dimensions * (1 if self.quantization == 'int8' else 4)
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Arrays and settings needed to rebuild this compressor."""
+        state = {
+            'dimensions': np.array(self.dimensions),
+            'method': np.array(self.method),
+            'quantization': np.array(self.quantization or '')
+        }
+        for name in ('mean', 'components', 'scales'):
+            if getattr(self, name) is not None:
+                state[name] = getattr(self, name)
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict[str, np.ndarray]) -> 'VectorCompressor':
+        compressor = cls(
+            dimensions=int(state['dimensions']),
+            method=str(state['method']),
+            quantization=str(state['quantization']) or None
+        )
+        compressor.mean = state.get('mean')
+        compressor.components = state.get('components')
+        compressor.scales = state.get('scales')
+        return compressor
+
+
+class CompressedIndex:
+    """Compressed vectors in memory with exact rescoring from full vectors.
+
+    ``codes`` (int8 or reduced float32) are scanned to build a shortlist;
+    ``full_vectors`` may be a read-only memory map, so only shortlisted rows
+    are read back at full precision. Distances are squared L2, matching
+    Chroma's default space.
+    """
+
+    def __init__(self, compressor: VectorCompressor, full_vectors: np.ndarray,
+                 codes: Optional[np.ndarray] = None, block_size: int = 65536):
+        self.compressor = compressor
+        self.full_vectors = full_vectors
+        self.codes = codes
+        self.block_size = block_size
+
+    @classmethod
+    def build(cls, compressor: VectorCompressor, embeddings: np.ndarray,
+              keep_codes: bool = True) -> 'CompressedIndex':
+        codes = compressor.encode(embeddings) if keep_codes else None
+        return cls(compressor, np.asarray(embeddings, dtype=np.float32), codes=codes)
+
+    def __len__(self) -> int:
+        return len(self.full_vectors)
+
+    def shortlist(self, query: np.ndarray, n: int) -> np.ndarray:
+        """Indices of the ``n`` best candidates by compressed similarity."""
+        if self.codes is None:
+            raise ValueError("This index keeps no compressed codes to scan")
+
+        weights = self.compressor.reduce(query)[0]
+        if self.compressor.quantization == 'int8':
+            weights = weights * self.compressor.scales
+
+        # Score in blocks so int8 codes are never upcast all at once
+        scores = np.empty(len(self.codes), dtype=np.float32)
+        for start in range(0, len(self.codes), self.block_size):
+            block = self.codes[start:start + self.block_size].astype(np.float32)
+            scores[start:start + len(block)] = block @ weights
+
+        n = min(n, len(scores))
+        candidates = np.argpartition(-scores, n - 1)[:n]
+        return candidates[np.argsort(-scores[candidates])]
+
+    def rescore(self, query: np.ndarray, candidates, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Re-rank candidates with full-precision vectors."""
+        candidates = np.sort(np.asarray(candidates, dtype=np.int64))
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        vectors = np.asarray(self.full_vectors[candidates], dtype=np.float32)
+        distances = ((vectors - query) ** 2).sum(axis=1)
+        order = np.argsort(distances)[:top_k]
+        return candidates[order], distances[order]
+
+    def search(self, query: np.ndarray, top_k: int, rescore_factor: int = 4,
+               rescore: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Shortlist ``top_k * rescore_factor`` candidates, then rescore them."""
+        if not rescore:
+            candidates = self.shortlist(query, top_k)
+            return self.rescore(query, candidates, top_k)
+        return self.rescore(query, self.shortlist(query, top_k * rescore_factor), top_k)
+
+    def memory_bytes(self) -> int:
+        """Bytes held in memory by the compressed codes."""
+        return 0 if self.codes is None else self.codes.nbytes
+
+
+def exact_search(embeddings: np.ndarray, query: np.ndarray, top_k: int) -> np.ndarray:
+    """Brute-force nearest neighbours by squared L2, for recall measurements."""
+    distances = ((np.asarray(embeddings, dtype=np.float32) - query) ** 2).sum(axis=1)
+    return np.argsort(distances)[:top_k]
+
+
+def recall_at_k(found: List[np.ndarray], expected: List[np.ndarray]) -> float:
+    """Mean fraction of the exact top-k neighbours that were found."""
+    hits = [len(set(f.tolist()) & set(e.tolist())) / len(e) for f, e in zip(found, expected)]
+    return sum(hits) / len(hits) if hits else 0.0
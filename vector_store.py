@@ -3,60 +3,274 @@
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Callable
 import numpy as np
+import os
+from vector_compression import VectorCompressor, CompressedIndex
 
 class VectorStore:
     """Manages vector embeddings and similarity search using ChromaDB."""
     
-    def __init__(self, db_path: str, collection_name: str, embedding_model: str):
+    def __init__(self, db_path: str, collection_name: str, embedding_model,
+                 reduced_dimension: Optional[int] = None, reduction_method: str = 'pca',
+                 quantization: Optional[str] = None, rescore_factor: int = 4):
         self.db_path = db_path
         self.collection_name = collection_name
         
-        # Initialize embedding model
-        self.embedding_model = SentenceTransformer(embedding_model)
+        # Optional compression: Chroma stores reduced vectors (or, with int8,
+        # only documents and metadata), full-precision vectors stay on disk
+        # for rescoring the shortlist
+        self.reduced_dimension = reduced_dimension
+        self.reduction_method = reduction_method
+        self.quantization = quantization
+        self.rescore_factor = rescore_factor
+        self.compression_enabled = reduced_dimension is not None or quantization is not None
+        self.vectors_path = f"{db_path.rstrip('/')}_vectors"
+        self._compressed = {}
+        
+        # Initialize embedding model; an already loaded model can be shared
+        if isinstance(embedding_model, str):
+            embedding_model = SentenceTransformer(embedding_model)
+        self.embedding_model = embedding_model
         
         # Initialize ChromaDB
         self.client = chromadb.PersistentClient(path=db_path)
+        self.version = self._latest_version()
         self.collection = self._get_or_create_collection()
     
-    def _get_or_create_collection(self):
+    def _versioned_name(self, version: int) -> str:
+        """Collection name for an index version; version 0 is the legacy name."""
+        if version == 0:
+            return self.collection_name
+        return f"{self.collection_name}_v{version}"
+    
+    def list_versions(self) -> List[int]:
+        """Index versions present in the database, oldest first."""
+        versions = []
+        prefix = f"{self.collection_name}_v"
+        for collection in self.client.list_collections():
+            suffix = collection.name[len(prefix):]
+            if collection.name == self.collection_name:
+                versions.append(0)
+            elif collection.name.startswith(prefix) and suffix.isdigit():
+                versions.append(int(suffix))
+        return sorted(versions)
+    
+    def _latest_version(self) -> int:
+        """Highest index version already present in the database."""
+        versions = self.list_versions()
+        return versions[-1] if versions else 0
+    
+    def _get_or_create_collection(self, version: Optional[int] = None):
         """Get existing collection or create new one."""
+        name = self._versioned_name(self.version if version is None else version)
         try:
-            collection = self.client.get_collection(name=self.collection_name)
+            collection = self.client.get_collection(name=name)
         except:
             collection = self.client.create_collection(
-                name=self.collection_name,
+                name=name,
                 metadata={"description": "Event document embeddings"}
             )
         return collection
     
-    def add_documents(self, chunks: List[Dict[str, any]]) -> None:
-        """Add document chunks to vector database."""
-        texts = [chunk['text'] for chunk in chunks]
-        metadatas = [chunk['metadata'] for chunk in chunks]
+    def embed_chunks(self, chunks: List[Dict[str, any]],
+                     progress_callback: Optional[Callable[[int, int], None]] = None,
+                     batch_size: int = 64) -> np.ndarray:
+        """Embed chunk texts in batches; ``progress_callback(done, total)`` follows each batch."""
+        batches = []
+        for start in range(0, len(chunks), batch_size):
+            texts = [chunk['text'] for chunk in chunks[start:start + batch_size]]
+            batches.append(np.asarray(
+                self.embedding_model.encode(texts, convert_to_tensor=False), dtype=np.float32
+            ))
+            if progress_callback is not None:
+                progress_callback(start + len(texts), len(chunks))
+        
+        if not batches:
+            return np.zeros((0, self.embedding_model.get_sentence_embedding_dimension()), dtype=np.float32)
+        return np.vstack(batches)
+    
+    def add_documents(self, chunks: List[Dict[str, any]], collection=None,
+                      progress_callback: Optional[Callable[[int, int], None]] = None,
+                      batch_size: int = 64, embeddings: Optional[np.ndarray] = None) -> None:
+        """Add document chunks to vector database.
+        
+        Chunks are embedded in batches unless precomputed ``embeddings`` are
+        given. With compression enabled, the reduced vectors are stored in
+        Chroma and the full-precision ones are kept for rescoring. With int8
+        quantization searches scan the in-memory codes instead, so Chroma
+        gets a one-dimensional placeholder rather than a float vector.
+        """
+        if collection is None:
+            collection = self.collection
         
         # Generate embeddings
-        embeddings = self.embedding_model.encode(texts, convert_to_tensor=False)
+        if embeddings is None:
+            embeddings = self.embed_chunks(chunks, progress_callback, batch_size)
         
-        # Create unique IDs for each chunk
-        ids = [f"chunk_{i}" for i in range(len(texts))]
+        stored = embeddings
+        if self.compression_enabled and len(embeddings):
+            compressor = VectorCompressor(
+                dimensions=self.reduced_dimension,
+                method=self.reduction_method,
+                quantization=self.quantization
+            ).fit(embeddings)
+            compressed = self._save_compressed(collection.name, compressor, embeddings)
+            self._compressed[collection.name] = compressed
+            if compressed.codes is not None:
+                # Chroma requires an embedding per record; keep it minimal
+                stored = np.zeros((len(embeddings), 1), dtype=np.float32)
+            else:
+                stored = compressor.reduce(embeddings)
         
-        # Add to collection
-        self.collection.add(
-            embeddings=embeddings.tolist(),
-            documents=texts,
-            metadatas=metadatas,
-            ids=ids
-        )
+        for start in range(0, len(chunks), batch_size):
+            batch = chunks[start:start + batch_size]
+            
+            # Create unique IDs for each chunk
+            ids = [f"chunk_{i}" for i in range(start, start + len(batch))]
+            
+            # Add to collection
+            collection.add(
+                embeddings=stored[start:start + len(batch)].tolist(),
+                documents=[chunk['text'] for chunk in batch],
+                metadatas=[chunk['metadata'] for chunk in batch],
+                ids=ids
+            )
+    
+    def _save_compressed(self, name: str, compressor: VectorCompressor,
+                         embeddings: np.ndarray) -> CompressedIndex:
+        """Persist full-precision vectors and return an index that memory-maps them."""
+        os.makedirs(self.vectors_path, exist_ok=True)
+        path = os.path.join(self.vectors_path, f"{name}.npy")
+        np.save(path, np.asarray(embeddings, dtype=np.float32))
+        
+        codes = compressor.encode(embeddings) if self.quantization else None
+        return CompressedIndex(compressor, np.load(path, mmap_mode='r'), codes=codes)
+    
+    def export_vectors(self, collection=None) -> Tuple[List[Dict[str, any]], np.ndarray]:
+        """All chunks of a collection in chunk order, with full-precision embeddings."""
+        if collection is None:
+            collection = self.collection
+        
+        records = collection.get(include=['documents', 'metadatas', 'embeddings'])
+        order = sorted(range(len(records['ids'])), key=lambda i: int(records['ids'][i].split('_')[1]))
+        chunks = [
+            {'text': records['documents'][i], 'metadata': records['metadatas'][i]}
+            for i in order
+        ]
+        
+        # Chroma holds reduced vectors or placeholders when compression is on
+        compressed = self._compressed.get(collection.name)
+        if compressed is not None:
+            embeddings = np.asarray(compressed.full_vectors, dtype=np.float32)
+        else:
+            embeddings = np.asarray([records['embeddings'][i] for i in order], dtype=np.float32)
+        return chunks, embeddings
+    
+    def embedding_fingerprint(self, probe: str) -> Dict[str, any]:
+        """Identify the embedding model by its name, dimension and output on a probe text."""
+        probe_embedding = self.embedding_model.encode([probe], convert_to_tensor=False)[0]
+        return {
+            'dimension': int(len(probe_embedding)),
+            'probe': probe,
+            'probe_embedding': [float(x) for x in probe_embedding]
+        }
     
-    def search_similar(self, query: str, top_k: int = 5) -> List[Dict[str, any]]:
-        """Search for similar documents based on query."""
+    def get_compression_stats(self, collection=None) -> Optional[Dict[str, any]]:
+        """Memory used by the compressed representation of a collection."""
+        if collection is None:
+            collection = self.collection
+        index = self._compressed.get(collection.name)
+        if index is None:
+            return None
+        
+        full_dimension = index.full_vectors.shape[1]
+        return {
+            'vectors': len(index),
+            'dimensions': index.compressor.dimensions,
+            'quantization': index.compressor.quantization,
+            **self.bytes_per_vector(index.compressor.dimensions, index.compressor.quantization),
+            'full_bytes_per_vector': full_dimension * 4,
+            'in_memory_codes_bytes': index.memory_bytes()
+        }
+    
+    @staticmethod
+    def bytes_per_vector(dimensions: int, quantization: Optional[str] = None) -> Dict[str, int]:
+        """Vector bytes held per chunk: float32 in Chroma plus int8 codes in memory.
+        
+        Chroma's HNSW graph overhead and the memory-mapped full-precision
+        vectors used for rescoring are not included.
+        """
+        if quantization == 'int8':
+            chroma_bytes, codes_bytes = 4, dimensions
+        else:
+            chroma_bytes, codes_bytes = dimensions * 4, 0
+        return {
+            'chroma_bytes_per_vector': chroma_bytes,
+            'codes_bytes_per_vector': codes_bytes,
+            'stored_bytes_per_vector': chroma_bytes + codes_bytes
+        }
+    
+    def build_collection(self, chunks: List[Dict[str, any]],
+                         progress_callback: Optional[Callable[[int, int], None]] = None,
+                         embeddings: Optional[np.ndarray] = None):
+        """Embed chunks into a new versioned collection without touching the live one.
+        
+        Precomputed ``embeddings`` skip the embedding step. Returns ``(version, collection)``; call ``activate_collection`` to
+        start serving it.
+        """
+        version = self._latest_version() + 1
+        name = self._versioned_name(version)
+        try:
+            self.client.delete_collection(name=name)
+        except:
+            pass
+        collection = self._get_or_create_collection(version)
+        try:
+            self.add_documents(chunks, collection=collection, progress_callback=progress_callback,
+                               embeddings=embeddings)
+        except Exception:
+            # Don't leave a partial version behind to be picked up on restart
+            self.drop_version(version)
+            raise
+        return version, collection
+    
+    def activate_collection(self, version: int, collection) -> None:
+        """Make a built collection the default for searches without a snapshot."""
+        self.version, self.collection = version, collection
+    
+    def drop_version(self, version: int) -> None:
+        """Delete the collection of an index version that is no longer used."""
+        name = self._versioned_name(version)
+        self._compressed.pop(name, None)
+        try:
+            self.client.delete_collection(name=name)
+        except:
+            pass
+        
+        vectors_file = os.path.join(self.vectors_path, f"{name}.npy")
+        if os.path.exists(vectors_file):
+            os.remove(vectors_file)
+    
+    def search_similar(self, query: str, top_k: int = 5, collection=None) -> List[Dict[str, any]]:
+        """Search for similar documents based on query.
+        
+        ``collection`` pins the search to a specific index version; by default
+        the live collection is used.
+        """
+        # Read the live collection once so a concurrent swap can't change it mid-query
+        if collection is None:
+            collection = self.collection
+        
         # Generate query embedding
         query_embedding = self.embedding_model.encode([query], convert_to_tensor=False)
         
+        compressed = self._compressed.get(collection.name)
+        if compressed is not None:
+            return self._search_compressed(compressed, collection, query_embedding[0], top_k)
+        
         # Search in collection
-        results = self.collection.query(
+        results = collection.query(
             query_embeddings=query_embedding.tolist(),
             n_results=top_k
         )
@@ -72,10 +286,45 @@ class VectorStore:
         
         return formatted_results
     
+    def _search_compressed(self, index: CompressedIndex, collection, query_embedding: np.ndarray,
+                           top_k: int) -> List[Dict[str, any]]:
+        """Shortlist on compressed vectors, then rescore at full precision."""
+        n_candidates = top_k * self.rescore_factor
+        if index.codes is not None:
+            candidates = index.shortlist(query_embedding, n_candidates)
+        else:
+            results = collection.query(
+                query_embeddings=index.compressor.reduce(query_embedding).tolist(),
+                n_results=min(n_candidates, len(index)),
+                include=[]
+            )
+            candidates = [int(chunk_id.split('_')[1]) for chunk_id in results['ids'][0]]
+        
+        if len(candidates) == 0:
+            return []
+        
+        indices, distances = index.rescore(query_embedding, candidates, top_k)
+        ids = [f"chunk_{i}" for i in indices]
+        records = collection.get(ids=ids, include=['documents', 'metadatas'])
+        by_id = {
+            chunk_id: (document, metadata)
+            for chunk_id, document, metadata in zip(records['ids'], records['documents'], records['metadatas'])
+        }
+        
+        return [
+            {
+                'text': by_id[chunk_id][0],
+                'metadata': by_id[chunk_id][1],
+                'distance': float(distance)
+            }
+            for chunk_id, distance in zip(ids, distances)
+            if chunk_id in by_id
+        ]
+    
     def clear_collection(self) -> None:
         """Clear all documents from collection."""
         try:
-            self.client.delete_collection(name=self.collection_name)
+            self.client.delete_collection(name=self._versioned_name(self.version))
             self.collection = self._get_or_create_collection()
         except:
             pass